@@ -0,0 +1,54 @@
+"""Peak memory of `aio.map` fan-out against bounded streaming `aio.imap`.
+
+`aio.map` creates a coroutine per item up front, `aio.imap` keeps at most
+`max_concurrency` tasks in flight and pulls items lazily.
+
+    python -m benchmarks.aio_map [items]
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from tibia.iterable import aio
+
+
+async def fetch(x: int) -> int:
+    await asyncio.sleep(0)
+    return x
+
+
+async def gather_all(items: int) -> int:
+    return sum(await aio.map(range(items), fetch))
+
+
+async def stream(items: int) -> int:
+    return sum([x async for x in aio.imap(range(items), fetch, max_concurrency=64)])
+
+
+async def stream_sum(items: int) -> int:
+    total = 0
+
+    async for x in aio.imap(range(items), fetch, max_concurrency=64):
+        total += x
+
+    return total
+
+
+def measure(name: str, items: int) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(globals()[name](items))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<12} {peak / 2**20:>10.1f} MiB peak {elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    for name in ("gather_all", "stream", "stream_sum"):
+        measure(name, items)
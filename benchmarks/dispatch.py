@@ -0,0 +1,64 @@
+"""10-step `Result` and `Maybe` chains over many values.
+
+Compares specialized `Ok`/`Err`/`Some`/`Empty` methods with dispatch via
+module-level functions (how methods were implemented before).
+
+    python -m benchmarks.dispatch [values]
+"""
+
+import sys
+import time
+
+from tibia import maybe, result
+from tibia.maybe import Empty, Some
+from tibia.result import Err, Ok
+
+STEPS = 10
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def forwarded(module):
+    # previous implementation: method -> module function -> isinstance check
+    def _map(container, fn, *args, **kwargs):
+        return module.map(container, fn, *args, **kwargs)
+
+    return _map
+
+
+def run_forwarded(containers, _map) -> None:
+    for container in containers:
+        for _ in range(STEPS):
+            container = _map(container, inc)
+
+
+def run_methods(containers) -> None:
+    for container in containers:
+        for _ in range(STEPS):
+            container = container.map(inc)
+
+
+def measure(name: str, containers) -> None:
+    module = result if isinstance(containers[0], Ok | Err) else maybe
+
+    start = time.perf_counter()
+    run_forwarded(containers, forwarded(module))
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    run_methods(containers)
+    after = time.perf_counter() - start
+
+    print(f"{name:<8} {before:>10.2f}s {after:>10.2f}s {before / after:>7.2f}x")
+
+
+if __name__ == "__main__":
+    values = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print(f"{'chain':<8} {'forwarded':>11} {'methods':>11} {'speedup':>8}")
+    measure("Ok", [Ok(i) for i in range(values)])
+    measure("Err", [Err(i) for i in range(values)])
+    measure("Some", [Some(i) for i in range(values)])
+    measure("Empty", [Empty()] * values)
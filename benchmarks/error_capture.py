@@ -0,0 +1,52 @@
+"""Memory retained by `Err` values produced by `result.safe_from`.
+
+Every failing call has some local data in its frame. Default mode keeps the
+exception (and so its traceback, frames and locals) alive, record modes keep
+only `ErrorRecord`.
+
+    python -m benchmarks.error_capture [failures]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from tibia.result import safe_from
+
+MODES = {
+    "exception": {},
+    "record": {"record": True},
+    "record+traceback": {"record": True, "with_traceback": True},
+}
+
+
+def parse(row: str) -> int:
+    fields = row.split(",")  # noqa: F841 - lives in the frame of failed call
+    raise ValueError(f"invalid row: {row}")
+
+
+def measure(name: str, failures: int) -> None:
+    safe_parse = safe_from(ValueError, **MODES[name])(parse)
+    row = "x," * 16
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    errs = [safe_parse(row) for _ in range(failures)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{name:<18} {current / 2**20:>10.1f} MiB "
+        f"{current / failures:>8.0f} B/err {elapsed:>8.2f}s"
+    )
+    del errs
+
+
+if __name__ == "__main__":
+    failures = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    for name in MODES:
+        measure(name, failures)
@@ -0,0 +1,50 @@
+"""Per-key counting of high-cardinality keys in memory and with spilling.
+
+`external.group_by_reduce_to` keeps at most `max_keys` keys in memory and
+partitions the rest into temporary files by key hash.
+
+    python -m benchmarks.external_group_by [items] [max_keys]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from tibia.iterable import eager, external
+
+
+def events(items: int):
+    return (f"user-{i * 7919 % items}" for i in range(items))
+
+
+def count(acc: int, _: str) -> int:
+    return acc + 1
+
+
+def measure(name: str, group) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    groups = sum(1 for _ in group())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{name:<10} {groups:>10} groups {elapsed:>8.2f}s {peak / 2**20:>8.1f} MiB peak"
+    )
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    max_keys = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+
+    measure(
+        "eager",
+        lambda: eager.group_by_reduce_to(events(items), str, count, int).items(),
+    )
+    measure(
+        "external",
+        lambda: external.group_by_reduce_to(
+            events(items), str, count, int, max_keys=max_keys
+        ),
+    )
@@ -0,0 +1,47 @@
+"""`external.sort_asc` against in-memory `eager.sort_asc` on generated records.
+
+Records are produced by a generator and consumed one by one, so peak memory of
+external sort is bounded by `run_size`, while in-memory sort holds all of them.
+
+    python -m benchmarks.external_sort [items] [run_size]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from tibia.iterable import eager, external
+
+
+def records(items: int):
+    rng = random.Random(0)
+
+    for i in range(items):
+        yield (rng.random(), f"record-{i}")
+
+
+def measure(name: str, sort, items: int) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    for _ in sort(records(items)):
+        pass
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<10} {elapsed:>8.2f}s {peak / 2**20:>10.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    run_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+    measure("eager", eager.sort_asc, items)
+    measure(
+        "external",
+        lambda iterable: external.sort_asc(iterable, run_size=run_size),
+        items,
+    )
@@ -0,0 +1,64 @@
+"""Per-step overhead of `Future` chains.
+
+Compares fused `Future` with the previous implementation, where every step
+wrapped the previous awaitable into a new coroutine.
+
+    python -m benchmarks.future_chain
+"""
+
+import asyncio
+import functools
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable
+
+from tibia.future import Future
+from tibia.utils import identity, identity_async
+
+LENGTHS = (10, 100, 1000)
+ROUNDS = 200
+
+
+@dataclass(slots=True)
+class NestedFuture:
+    _internal: Awaitable[Any]
+
+    def __await__(self):
+        return self._internal.__await__()
+
+    def map(self, func, *args, **kwargs):
+        @functools.wraps(func)
+        async def _map(value, *args, **kwargs):
+            return func(await value, *args, **kwargs)
+
+        return NestedFuture(_map(self._internal, *args, **kwargs))
+
+
+async def measure(container, length: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(ROUNDS):
+        future = container(identity_async(0))
+
+        for _ in range(length):
+            future = future.map(identity)
+
+        await future
+
+    return (time.perf_counter() - start) / ROUNDS / length * 1e9
+
+
+async def main():
+    # nested coroutines recurse on await: 1000 steps need deeper stack
+    sys.setrecursionlimit(10_000)
+    print(f"{'steps':>6} {'nested ns/step':>15} {'fused ns/step':>14}")
+
+    for length in LENGTHS:
+        nested_ns = await measure(NestedFuture, length)
+        fused_ns = await measure(Future, length)
+        print(f"{length:>6} {nested_ns:>15.0f} {fused_ns:>14.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,53 @@
+"""Per-key aggregation with `group_by` lists against folding aggregators.
+
+python -m benchmarks.group_by_aggregate [items] [keys]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from tibia.iterable import eager
+
+
+def measure(name: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    # memory is traced in a separate run, as tracing slows down allocations
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<26} {elapsed:>8.2f}s {peak / 2**20:>10.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    keys = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+
+    def events():
+        return (i * 7919 % 10_007 for i in range(items))
+
+    def bucket(x: int) -> int:
+        return x % keys
+
+    measure(
+        "group_by + len",
+        lambda: {k: len(v) for k, v in eager.group_by(events(), bucket).items()},
+    )
+    measure(
+        "group_by_reduce_to count",
+        lambda: eager.group_by_reduce_to(events(), bucket, lambda a, _: a + 1, int),
+    )
+    measure(
+        "aggregate count", lambda: eager.group_by_aggregate(events(), bucket, "count")
+    )
+    measure(
+        "group_by + max",
+        lambda: {k: max(v) for k, v in eager.group_by(events(), bucket).items()},
+    )
+    measure("group_by_reduce max", lambda: eager.group_by_reduce(events(), bucket, max))
+    measure("aggregate max", lambda: eager.group_by_aggregate(events(), bucket, "max"))
@@ -0,0 +1,62 @@
+"""Same 8-step chain applied to many records via `Value` and `Pipeline`.
+
+python -m benchmarks.pipeline
+"""
+
+import time
+
+from tibia.iterable import eager
+from tibia.pipeline import Pipeline
+from tibia.value import Value
+
+RECORDS = 1_000_000
+
+
+def add(x: int, y: int) -> int:
+    return x + y
+
+
+def double(x: int) -> int:
+    return x * 2
+
+
+def value_chain(x: int) -> int:
+    return (
+        Value(x)
+        .map(add, 1)
+        .map(double)
+        .map(add, -1)
+        .map(double)
+        .map(add, 3)
+        .map(double)
+        .map(add, y=-3)
+        .map(double)
+        .unwrap()
+    )
+
+
+pipeline = (
+    Pipeline[int, int]()
+    .map(add, 1)
+    .map(double)
+    .map(add, -1)
+    .map(double)
+    .map(add, 3)
+    .map(double)
+    .map(add, y=-3)
+    .map(double)
+)
+
+
+def measure(name: str, run) -> None:
+    start = time.perf_counter()
+    run(range(RECORDS))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {elapsed:>6.2f}s {elapsed / RECORDS * 1e9:>8.0f} ns/record")
+
+
+if __name__ == "__main__":
+    measure("Value chain", lambda items: eager.map(items, value_chain))
+    measure("eager.map(pipeline)", lambda items: eager.map(items, pipeline))
+    measure("eager.map(compiled)", lambda items: eager.map(items, pipeline.compile()))
+    measure("Pipeline.apply", pipeline.apply)
@@ -0,0 +1,42 @@
+"""Thread, process and interpreter pools on pure-Python CPU work.
+
+Every pool has the same number of workers and is started before measuring.
+Interpreter pool is skipped before python 3.14.
+
+    python -m benchmarks.pool_backends [items] [work]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.process_map import burn
+from tibia.iterable import interpreter, process, threaded
+
+
+def measure(name: str, module, executor, items: int, work: int) -> None:
+    start = time.perf_counter()
+    total = sum(module.map(range(items), burn, work, executor=executor))
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<12} {elapsed:>8.2f}s {total}")
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    work = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    workers = os.cpu_count() or 1
+
+    with ThreadPoolExecutor(workers) as executor:
+        measure("thread", threaded, executor, items, work)
+
+    with process.warm_pool(workers) as executor:
+        measure("process", process, executor, items, work)
+
+    if interpreter.InterpreterPoolExecutor is None:
+        print("interpreter  requires python 3.14")
+    else:
+        with interpreter.InterpreterPoolExecutor(workers) as executor:
+            list(executor.map(abs, range(workers)))
+            measure("interpreter", interpreter, executor, items, work)
@@ -0,0 +1,49 @@
+"""`process.map` against `threaded.map` and `lazy.map` on pure-Python CPU work.
+
+Threads are serialized by the GIL, processes run in parallel (pool is warmed
+before measuring, so worker startup is not counted).
+
+    python -m benchmarks.process_map [items] [work]
+"""
+
+import sys
+import time
+
+from tibia.iterable import lazy, process, threaded
+
+
+def burn(x: int, work: int) -> int:
+    total = 0
+
+    for i in range(work):
+        total += (x * i) % 7
+
+    return total
+
+
+def measure(name: str, run) -> None:
+    start = time.perf_counter()
+    total = sum(run())
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<18} {elapsed:>8.2f}s {total}")
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    work = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+
+    measure("lazy", lambda: lazy.map(range(items), burn, work))
+    measure("threaded", lambda: threaded.map(range(items), burn, work))
+
+    with process.warm_pool() as executor:
+        measure(
+            "process",
+            lambda: process.map(range(items), burn, work, executor=executor),
+        )
+        measure(
+            "process ordered",
+            lambda: process.map(
+                range(items), burn, work, executor=executor, ordered=True
+            ),
+        )
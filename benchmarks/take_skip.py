@@ -0,0 +1,59 @@
+"""`eager.take` and `eager.skip` on generators against former implementations.
+
+Former ones filtered by `enumerate` index over the whole input (and copied it
+into a list for negative counts), current ones stop early with `islice` and
+keep only `|count|` items in a ring buffer.
+
+    python -m benchmarks.take_skip [items] [count]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from tibia.iterable import eager
+
+
+def legacy_take(iterable, count):
+    if count == 0:
+        return []
+    elif count > 0:
+        return [item for i, item in enumerate(iterable) if i < count]
+    else:
+        _iterable = list(iterable)
+        _iterable_len = len(_iterable)
+        return [item for i, item in enumerate(_iterable) if i >= _iterable_len + count]
+
+
+def legacy_skip(iterable, count):
+    if count == 0:
+        return list(iterable)
+    elif count > 0:
+        return [item for i, item in enumerate(iterable) if i >= count]
+    else:
+        _iterable = list(iterable)
+        _iterable_len = len(_iterable)
+        return [item for i, item in enumerate(_iterable) if i < _iterable_len + count]
+
+
+def measure(name: str, func, items: int, count: int) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func((x for x in range(items)), count)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<22} {elapsed:>8.3f}s {peak / 2**20:>10.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    for name, func in [("take", eager.take), ("legacy take", legacy_take)]:
+        measure(f"{name}({count})", func, items, count)
+        measure(f"{name}({-count})", func, items, -count)
+
+    for name, func in [("skip", eager.skip), ("legacy skip", legacy_skip)]:
+        measure(f"{name}({-count})", func, items, -count)
@@ -0,0 +1,43 @@
+"""Scaling of `threaded.map` on pure-Python CPU work from 1 to N workers.
+
+With GIL threads are serialized and speedup stays around 1x, free-threaded
+builds (3.13t and later, `python -X gil=0`) should scale with number of cores.
+
+    python -m benchmarks.threaded_scaling [items] [work]
+"""
+
+import os
+import sys
+import time
+
+from tibia.iterable import threaded
+
+
+def burn(x: int, work: int) -> int:
+    total = 0
+
+    for i in range(work):
+        total += (x * i) % 7
+
+    return total
+
+
+def measure(workers: int, items: int, work: int) -> float:
+    start = time.perf_counter()
+    sum(threaded.map(range(items), burn, work, max_workers=workers))
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    work = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    cpus = os.cpu_count() or 1
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+    print(f"GIL {'enabled' if gil else 'disabled'}, {cpus} cpus")
+
+    baseline = measure(1, items, work)
+
+    for workers in sorted({*(2**i for i in range(cpus.bit_length())), cpus}):
+        elapsed = baseline if workers == 1 else measure(workers, items, work)
+        print(f"{workers:>4} workers {elapsed:>8.2f}s {baseline / elapsed:>6.2f}x")
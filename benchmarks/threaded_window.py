@@ -0,0 +1,43 @@
+"""Time to first result and peak memory of `threaded.map` per window size.
+
+`window=items` submits every item before yielding, like the former
+`as_completed`-based implementation.
+
+    python -m benchmarks.threaded_window [items]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from tibia.iterable import threaded
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+def measure(name: str, items: int, window: int | None) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = threaded.map(range(items), square, window=window)
+    next(results)
+    first = time.perf_counter() - start
+    total = sum(results)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert total >= 0
+    print(
+        f"{name:<10} first {first * 1000:>10.2f} ms total {elapsed:>8.2f}s "
+        f"{peak / 2**20:>10.1f} MiB peak"
+    )
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    measure("default", items, None)
+    measure("1024", items, 1024)
+    measure("all", items, items)
@@ -0,0 +1,29 @@
+"""`eager.top_k` against `sort_desc` followed by `take` on random numbers.
+
+python -m benchmarks.top_k [items] [count]
+"""
+
+import random
+import sys
+import time
+
+from tibia.iterable import eager
+
+
+def measure(name: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<20} {elapsed:>8.3f}s")
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    numbers = [random.random() for _ in range(items)]
+
+    measure("sort_desc + take", lambda: eager.take(eager.sort_desc(numbers), count))
+    measure("top_k", lambda: eager.top_k(numbers, count))
+    measure("sort_desc(key)", lambda: eager.sort_desc(numbers, abs)[:count])
+    measure("top_k(key)", lambda: eager.top_k(numbers, count, abs))
@@ -1,3 +1,6 @@
+import asyncio
+from typing import AsyncIterator, Iterator
+
 import pytest
 
 from tests.utils import add, add_async, is_even, is_even_async
@@ -29,3 +32,190 @@ async def test_filter(numbers: list[int]):
     result = await iterable.aio.filter(numbers, is_even_async)
 
     assert result == [x for x in numbers if is_even(x)]
+
+
+class _Tracker:
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self.pulled = 0
+
+    def source(self, n: int) -> Iterator[int]:
+        for i in range(n):
+            self.pulled += 1
+            yield i
+
+    async def double(self, x: int) -> int:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+
+        try:
+            await asyncio.sleep(0.01 * (x % 3))
+            return x * 2
+        finally:
+            self.running -= 1
+
+
+@pytest.mark.asyncio
+async def test_map_max_concurrency(numbers: list[int]):
+    tracker = _Tracker()
+
+    result = await iterable.aio.map(numbers, tracker.double, max_concurrency=3)
+
+    assert result == [x * 2 for x in numbers]
+    assert tracker.peak == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_imap(ordered: bool):
+    tracker = _Tracker()
+
+    result = [
+        x
+        async for x in iterable.aio.imap(
+            tracker.source(20), tracker.double, max_concurrency=4, ordered=ordered
+        )
+    ]
+
+    if ordered:
+        assert result == [x * 2 for x in range(20)]
+    else:
+        assert sorted(result) == [x * 2 for x in range(20)]
+        assert result != [x * 2 for x in range(20)]
+
+    assert tracker.peak == 4
+
+
+@pytest.mark.asyncio
+async def test_imap_async_iterable(numbers: list[int]):
+    async def source() -> AsyncIterator[int]:
+        for x in numbers:
+            yield x
+
+    result = [x async for x in iterable.aio.imap(source(), add_async, 1)]
+
+    assert result == [add(x, 1) for x in numbers]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_imap_backpressure(ordered: bool):
+    tracker = _Tracker()
+    results = iterable.aio.imap(
+        tracker.source(1_000_000), tracker.double, max_concurrency=5, ordered=ordered
+    )
+
+    async for _ in results:
+        break
+
+    await results.aclose()
+
+    assert tracker.pulled <= 6
+    assert tracker.running == 0
+
+
+@pytest.mark.asyncio
+async def test_imap_raises():
+    async def fail(x: int) -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError(x)
+
+    with pytest.raises(ValueError):
+        [x async for x in iterable.aio.imap(range(10), fail, max_concurrency=2)]
+
+    with pytest.raises(ValueError):
+        [x async for x in iterable.aio.imap(range(10), add_async, 1, max_concurrency=0)]
+
+
+@pytest.mark.asyncio
+async def test_filter_keeps_order():
+    async def is_even_reversed_delay(x: int) -> bool:
+        await asyncio.sleep(0.01 * (10 - x))
+        return is_even(x)
+
+    result = await iterable.aio.filter(range(10), is_even_reversed_delay)
+
+    assert result == [0, 2, 4, 6, 8]
+
+
+@pytest.mark.asyncio
+async def test_filter_max_concurrency(numbers: list[int]):
+    tracker = _Tracker()
+
+    async def is_even_tracked(x: int) -> bool:
+        return is_even(await tracker.double(x) // 2)
+
+    result = await iterable.aio.filter(numbers, is_even_tracked, max_concurrency=3)
+
+    assert result == [x for x in numbers if is_even(x)]
+    assert tracker.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_filter_cancels_on_error():
+    cancelled = []
+
+    async def fail_on_three(x: int) -> bool:
+        try:
+            await asyncio.sleep(0 if x == 3 else 1)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+
+        if x == 3:
+            raise ValueError(x)
+
+        return True
+
+    with pytest.raises(ValueError):
+        await iterable.aio.filter(range(10), fail_on_three)
+
+    assert sorted(cancelled) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+
+    with pytest.raises(ValueError):
+        await iterable.aio.filter(range(10), is_even_async, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_group_by():
+    tracker = _Tracker()
+
+    async def is_even_tracked(x: int) -> bool:
+        return is_even(await tracker.double(x) // 2)
+
+    result = await iterable.aio.group_by(
+        tracker.source(6), is_even_tracked, max_concurrency=2
+    )
+
+    assert result == {True: [0, 2, 4], False: [1, 3, 5]}
+    assert tracker.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_group_by_reduce_to():
+    async def remainder(x: int, y: int) -> int:
+        await asyncio.sleep(0.01 * (x % 2))
+        return x % y
+
+    result = await iterable.aio.group_by_reduce_to(
+        range(10), remainder, lambda acc, x: acc + x, int, 3, max_concurrency=4
+    )
+
+    assert result == {0: 0 + 3 + 6 + 9, 1: 1 + 4 + 7, 2: 2 + 5 + 8}
+
+
+@pytest.mark.asyncio
+async def test_group_by_reduce_to_own_accumulators():
+    async def first_letter(word: str) -> str:
+        return word[0]
+
+    def append(group: list[str], word: str) -> list[str]:
+        group.append(word)
+        return group
+
+    result = await iterable.aio.group_by_reduce_to(
+        ["x1", "y1", "x2"], first_letter, append, list
+    )
+
+    assert result == {"x": ["x1", "x2"], "y": ["y1"]}
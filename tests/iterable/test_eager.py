@@ -1,3 +1,4 @@
+import itertools
 import math
 from copy import deepcopy
 from functools import reduce
@@ -86,6 +87,8 @@ def test_sort_desc(
         ([0, 1, 2, 3, 4], 0, []),
         ([0, 1, 2, 3, 4], 3, [0, 1, 2]),
         ([0, 1, 2, 3, 4], -3, [2, 3, 4]),
+        ([0, 1], 3, [0, 1]),
+        ([0, 1], -3, [0, 1]),
     ],
 )
 def test_take(nums: list[int], amount: int, target: list[int]):
@@ -114,6 +117,8 @@ def test_first(nums: list[int], default: int, target: int):
         ([0, 1, 2, 3, 4], 0, [0, 1, 2, 3, 4]),
         ([0, 1, 2, 3, 4], 3, [3, 4]),
         ([0, 1, 2, 3, 4], -3, [0, 1]),
+        ([0, 1], 3, []),
+        ([0, 1], -3, []),
     ],
 )
 def test_skip(nums: list[int], amount: int, target: list[int]):
@@ -122,6 +127,18 @@ def test_skip(nums: list[int], amount: int, target: list[int]):
     assert result == target
 
 
+def test_take_infinite():
+    assert iterable.take(itertools.count(), 3) == [0, 1, 2]
+    assert iterable.skip(
+        iterable.lazy.take_while(itertools.count(), lambda x: x < 5), 3
+    ) == [3, 4]
+
+
+def test_take_skip_generator():
+    assert iterable.take((x for x in range(10)), -2) == [8, 9]
+    assert iterable.skip((x for x in range(10)), -8) == [0, 1]
+
+
 def test_join():
     result = iterable.join([[0], [1, 2, 3], [4, 5]])
 
@@ -132,3 +149,105 @@ def test_group_by():
     result = iterable.group_by([0, 1, 2, 3, 4, 5], is_even)
 
     assert result == {True: [0, 2, 4], False: [1, 3, 5]}
+
+
+@pytest.mark.parametrize(
+    ("key", "args", "top", "bottom"),
+    [
+        (None, (), [9, 8, 7], [0, 1, 2]),
+        (lambda x, y: (x - y) ** 2, (4,), [9, 0, 8], [4, 3, 5]),
+    ],
+)
+def test_top_k_bottom_k(
+    numbers: list[int], key: Callable | None, args: tuple, top: list, bottom: list
+):
+    assert iterable.top_k(iter(numbers), 3, key, *args) == top
+    assert iterable.bottom_k(iter(numbers), 3, key, *args) == bottom
+    assert iterable.top_k(numbers, 3, key, *args) == iterable.take(
+        iterable.sort_desc(numbers, key, *args), 3
+    )
+    assert iterable.bottom_k(numbers, 3, key, *args) == iterable.take(
+        iterable.sort_asc(numbers, key, *args), 3
+    )
+
+
+def test_group_by_reduce():
+    result = iterable.group_by_reduce([1, 2, 3, 4, 5], is_even, add)
+
+    assert result == {False: 1 + 3 + 5, True: 2 + 4}
+
+
+def test_group_by_reduce_to():
+    result = iterable.group_by_reduce_to(
+        ["a", "bb", "cc", "d"],
+        lambda word, y: len(word) * y,
+        lambda acc, _: acc + 1,
+        int,
+        10,
+    )
+
+    assert result == {10: 2, 20: 2}
+
+
+def test_group_by_reduce_to_own_accumulators():
+    def append(group: list[str], word: str) -> list[str]:
+        group.append(word)
+        return group
+
+    result = iterable.group_by_reduce_to(
+        ["x1", "y1", "x2"], lambda word: word[0], append, list
+    )
+
+    assert result == {"x": ["x1", "x2"], "y": ["y1"]}
+
+
+@pytest.mark.parametrize(
+    ("aggregator", "reducer", "target"),
+    [
+        ("count", lambda acc, _: acc + 1, {False: 3, True: 3}),
+        ("sum", add, {False: 9 + 1 + 7, True: 4 + 2 + 0}),
+        ("min", min, {False: 1, True: 0}),
+        ("max", max, {False: 9, True: 4}),
+        ("first", lambda acc, _: acc, {False: 9, True: 4}),
+        ("last", lambda _, item: item, {False: 7, True: 0}),
+    ],
+)
+def test_group_by_aggregate(
+    aggregator: str, reducer: Callable, target: dict[bool, int]
+):
+    numbers = [9, 4, 1, 2, 7, 0]
+
+    result = iterable.group_by_aggregate(iter(numbers), is_even, aggregator)
+
+    assert result == target
+
+    if aggregator == "count":
+        assert result == iterable.group_by_reduce_to(numbers, is_even, reducer, int)
+    else:
+        assert result == iterable.group_by_reduce(numbers, is_even, reducer)
+
+
+@pytest.mark.parametrize(
+    ("aggregator", "target"),
+    [
+        ("count", {"a": 3, "b": 1}),
+        ("sum", {"a": 6, "b": 5}),
+        ("min", {"a": 1, "b": 5}),
+        ("max", {"a": 3, "b": 5}),
+        ("first", {"a": 3, "b": 5}),
+        ("last", {"a": 2, "b": 5}),
+    ],
+)
+def test_group_by_aggregate_value(aggregator: str, target: dict[str, int]):
+    events = [("a", 3), ("b", 5), ("a", 1), ("a", 2)]
+
+    result = iterable.group_by_aggregate(
+        events, lambda event: event[0], aggregator, value=lambda event: event[1]
+    )
+
+    assert result == target
+
+
+def test_group_by_aggregate_unknown():
+    with pytest.raises(ValueError):
+        iterable.group_by_aggregate([1], is_even, "median")
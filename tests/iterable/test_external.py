@@ -0,0 +1,135 @@
+import random
+from inspect import isgenerator
+from typing import Callable
+
+import pytest
+
+from tests.utils import add
+from tibia import iterable
+from tibia.iterable import external
+
+
+@pytest.fixture
+def records() -> list[tuple[int, int]]:
+    rng = random.Random(0)
+
+    return [(rng.randrange(50), i) for i in range(5_000)]
+
+
+@pytest.mark.parametrize("run_size", [3, 1024, 5_000, 100_000])
+@pytest.mark.parametrize(
+    ("key", "args"),
+    [
+        (None, ()),
+        (lambda record, y: record[0] % y, (7,)),
+    ],
+)
+def test_sort(
+    records: list[tuple[int, int]], run_size: int, key: Callable | None, args: tuple
+):
+    result_asc = external.sort_asc(iter(records), key, *args, run_size=run_size)
+    result_desc = external.sort_desc(records, key, *args, run_size=run_size)
+
+    assert list(result_asc) == iterable.sort_asc(records, key, *args)
+    assert list(result_desc) == iterable.sort_desc(records, key, *args)
+
+
+def test_sort_is_lazy():
+    result_gen = external.sort_asc(x % 10 for x in range(100))
+
+    assert next(result_gen) == 0
+    assert list(external.sort_desc([], run_size=3)) == []
+
+
+def test_spill_and_load(tmp_path):
+    with open(tmp_path / "run", "w+b") as file:
+        assert list(external._load(external._spill(list(range(3_000)), file))) == list(
+            range(3_000)
+        )
+
+
+@pytest.mark.parametrize("sort", [external.sort_asc, external.sort_desc])
+def test_invalid_run_size(sort: Callable):
+    with pytest.raises(ValueError):
+        sort([1, 2], run_size=0)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_merges_spilled_runs(
+    monkeypatch: pytest.MonkeyPatch, records: list[tuple[int, int]], reverse: bool
+):
+    monkeypatch.setattr(external, "_FAN_IN", 3)
+    sort = external.sort_desc if reverse else external.sort_asc
+
+    result = list(sort(records, lambda record: record[0], run_size=20))
+
+    assert result == sorted(records, key=lambda record: record[0], reverse=reverse)
+
+
+@pytest.mark.parametrize("max_keys", [1, 3, 49, 1_000])
+@pytest.mark.parametrize("partitions", [2, 64])
+def test_group_by(records: list[tuple[int, int]], max_keys: int, partitions: int):
+    result_gen = external.group_by(
+        iter(records),
+        lambda record, y: record[0] % y,
+        20,
+        max_keys=max_keys,
+        partitions=partitions,
+    )
+
+    assert isgenerator(result_gen)
+
+    result = list(result_gen)
+
+    assert len(result) == 20
+    assert dict(result) == iterable.group_by(records, lambda record: record[0] % 20)
+
+
+def test_group_by_spills(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(external, "_BATCH_SIZE", 4)
+    words = [f"user-{i % 500}" for i in range(3_000)]
+
+    result = dict(external.group_by(words, str.upper, max_keys=10, partitions=3))
+
+    assert result == iterable.group_by(words, str.upper)
+
+
+def test_group_by_reduce_to(records: list[tuple[int, int]]):
+    result = external.group_by_reduce_to(
+        records,
+        lambda record: record[0],
+        lambda acc, record: acc + record[1],
+        int,
+        max_keys=5,
+    )
+
+    assert dict(result) == iterable.group_by_reduce_to(
+        records, lambda record: record[0], lambda acc, record: acc + record[1], int
+    )
+
+
+def test_group_by_reduce_to_own_accumulators():
+    def append(group: list[str], word: str) -> list[str]:
+        group.append(word)
+        return group
+
+    result = external.group_by_reduce_to(
+        ["x1", "y1", "x2", "z1"],
+        lambda word: word[0],
+        append,
+        list,
+        max_keys=1,
+    )
+
+    assert dict(result) == {"x": ["x1", "x2"], "y": ["y1"], "z": ["z1"]}
+
+
+@pytest.mark.parametrize(("max_keys", "partitions"), [(0, 2), (1, 1)])
+def test_group_by_invalid(max_keys: int, partitions: int):
+    with pytest.raises(ValueError):
+        external.group_by([1], str, max_keys=max_keys, partitions=partitions)
+
+    with pytest.raises(ValueError):
+        external.group_by_reduce_to(
+            [1], str, add, int, max_keys=max_keys, partitions=partitions
+        )
@@ -0,0 +1,68 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from inspect import isgenerator
+from typing import Callable
+
+import pytest
+
+from tests.utils import add, is_even
+from tibia import iterable
+
+
+@pytest.fixture(scope="module")
+def executor():
+    # interpreter pool is not available before python 3.14, functions do not
+    # depend on executor type, so they are checked with a thread pool
+    with ThreadPoolExecutor(2) as executor:
+        yield executor
+
+
+def test_map(executor, numbers: list[int]):
+    result_gen = iterable.interpreter.map(numbers, add, 1, executor=executor)
+
+    assert isgenerator(result_gen)
+    assert sorted(result_gen) == [add(x, 1) for x in numbers]
+
+
+def test_inspect(executor, numbers: list[int]):
+    result = list(
+        iterable.interpreter.inspect(numbers, is_even, executor=executor, ordered=True)
+    )
+
+    assert result == numbers
+
+
+def test_filter(executor, numbers: list[int]):
+    result = list(
+        iterable.interpreter.filter(
+            numbers, is_even, executor=executor, ordered=True, window=3
+        )
+    )
+
+    assert result == [x for x in numbers if is_even(x)]
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 14), reason="requires python < 3.14")
+def test_not_available(numbers: list[int]):
+    with pytest.raises(RuntimeError):
+        list(iterable.interpreter.map(numbers, add, 1))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 14), reason="requires python 3.14")
+def test_own_pool(numbers: list[int]):  # pragma: no cover
+    result = list(iterable.interpreter.map(numbers, add, 1, ordered=True))
+
+    assert result == [add(x, 1) for x in numbers]
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        iterable.interpreter.map,
+        iterable.interpreter.inspect,
+        iterable.interpreter.filter,
+    ],
+)
+def test_window_invalid(executor, func: Callable):
+    with pytest.raises(ValueError):
+        func([1, 2], add, 1, executor=executor, window=0)
@@ -80,3 +80,13 @@ def test_join():
     result = list(result_gen)
 
     assert result == [0, 1, 2, 3, 4, 5]
+
+
+def test_top_k_bottom_k(numbers: list[int]):
+    top_gen = iterable.lazy.top_k(numbers, 3, lambda x, y: x % y, 5)
+    bottom_gen = iterable.lazy.bottom_k(iter(numbers), 2)
+
+    assert isgenerator(top_gen)
+    assert isgenerator(bottom_gen)
+    assert list(top_gen) == [4, 9, 3]
+    assert list(bottom_gen) == [0, 1]
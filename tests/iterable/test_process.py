@@ -0,0 +1,120 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from inspect import isgenerator
+from typing import Callable
+
+import pytest
+
+from tests.utils import add, is_even
+from tibia import iterable
+from tibia.iterable import process
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with process.warm_pool(2) as executor:
+        yield executor
+
+
+def test_map(executor):
+    result_gen = iterable.process.map(range(100), add, 1, executor=executor)
+
+    assert isgenerator(result_gen)
+    assert sorted(result_gen) == [add(x, 1) for x in range(100)]
+
+
+def test_map_ordered(executor):
+    result = list(
+        iterable.process.map(
+            iter(range(1000)), add, y=1, executor=executor, ordered=True
+        )
+    )
+
+    assert result == [add(x, 1) for x in range(1000)]
+
+
+def test_map_own_pool(numbers: list[int]):
+    result = list(
+        iterable.process.map(numbers, add, 1, max_workers=2, ordered=True, chunksize=3)
+    )
+
+    assert result == [add(x, 1) for x in numbers]
+
+
+def test_inspect(executor, numbers: list[int]):
+    result = list(iterable.process.inspect(numbers, is_even, executor=executor))
+
+    assert sorted(result) == numbers
+
+
+def test_filter(executor, numbers: list[int]):
+    result = list(
+        iterable.process.filter(numbers, is_even, executor=executor, ordered=True)
+    )
+
+    assert result == [x for x in numbers if is_even(x)]
+
+
+def test_warm_pool(executor):
+    pids = {executor.submit(os.getpid).result() for _ in range(20)}
+
+    assert len(pids) <= 2
+    assert os.getpid() not in pids
+
+
+@pytest.mark.parametrize(
+    ("items", "chunksize", "sizes"),
+    [
+        (list(range(10)), 3, [3, 3, 3, 1]),
+        (list(range(10)), None, [3, 3, 3, 1]),
+        (list(range(100)), None, [25, 25, 25, 25]),
+        (iter(range(10)), None, [1, 2, 4, 3]),
+        (iter(range(3000)), None, [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 953]),
+        ([], None, []),
+    ],
+)
+def test_chunks(items, chunksize: int | None, sizes: list[int]):
+    chunks = list(process._chunks(items, chunksize, 1))
+
+    assert [len(chunk) for chunk in chunks] == sizes
+    assert [x for chunk in chunks for x in chunk] == list(range(sum(sizes)))
+
+
+def test_apply_chunk():
+    assert process._apply_chunk([0, 1, 2], add, y=1) == [1, 2, 3]
+
+
+def test_default_pool_size(monkeypatch: pytest.MonkeyPatch):
+    sizes = []
+
+    class _Executor(ThreadPoolExecutor):
+        def __init__(self, max_workers: int | None = None):
+            sizes.append(max_workers)
+            super().__init__(max_workers)
+
+    monkeypatch.setattr(process, "ProcessPoolExecutor", _Executor)
+    monkeypatch.setattr(os, "cpu_count", lambda: 3)
+
+    assert sorted(iterable.process.map(range(5), add, 1)) == [1, 2, 3, 4, 5]
+    assert sizes == [3]
+
+
+def test_window(executor):
+    result = list(
+        iterable.process.map(
+            iter(range(100)), add, 1, executor=executor, ordered=True, window=1
+        )
+    )
+
+    assert result == [add(x, 1) for x in range(100)]
+
+
+@pytest.mark.parametrize(
+    "func", [iterable.process.map, iterable.process.inspect, iterable.process.filter]
+)
+@pytest.mark.parametrize(("window", "chunksize"), [(0, None), (None, 0)])
+def test_invalid_arguments(
+    executor, func: Callable, window: int | None, chunksize: int | None
+):
+    with pytest.raises(ValueError):
+        func(range(10), add, 1, executor=executor, window=window, chunksize=chunksize)
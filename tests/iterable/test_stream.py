@@ -0,0 +1,157 @@
+from inspect import isasyncgen
+from typing import AsyncIterator, Callable
+
+import pytest
+
+from tests.utils import add, add_async, is_even, is_even_async
+from tibia import iterable
+
+
+async def _source[T](items: list[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
+
+
+async def _collect[T](items: AsyncIterator[T]) -> list[T]:
+    return [item async for item in items]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("func", [add, add_async])
+async def test_map(numbers: list[int], func: Callable):
+    result_gen = iterable.stream.map(_source(numbers), func, 1)
+
+    assert isasyncgen(result_gen)
+    assert await _collect(result_gen) == [add(x, 1) for x in numbers]
+
+
+@pytest.mark.asyncio
+async def test_map_sync_iterable(numbers: list[int]):
+    result = await _collect(iterable.stream.map(numbers, add, 1))
+
+    assert result == [add(x, 1) for x in numbers]
+
+
+@pytest.mark.asyncio
+async def test_map_is_lazy():
+    pulled = []
+
+    async def source() -> AsyncIterator[int]:
+        for i in range(1_000_000):
+            pulled.append(i)
+            yield i
+
+    result_gen = iterable.stream.map(source(), add, 1)
+
+    assert await anext(result_gen) == 1
+    assert pulled == [0]
+
+    await result_gen.aclose()
+
+
+@pytest.mark.asyncio
+async def test_inspect():
+    seen = []
+
+    async def append_async(item: int) -> None:
+        seen.append(item)
+
+    result = await _collect(
+        iterable.stream.inspect(
+            iterable.stream.inspect(_source([1, 2, 3]), append_async), seen.append
+        )
+    )
+
+    assert result == [1, 2, 3]
+    assert seen == [1, 1, 2, 2, 3, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("func", [is_even, is_even_async])
+async def test_filter(numbers: list[int], func: Callable):
+    result = await _collect(iterable.stream.filter(_source(numbers), func))
+
+    assert result == [x for x in numbers if is_even(x)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("func", [is_even, is_even_async])
+async def test_skip_while(numbers: list[int], func: Callable):
+    result = await _collect(iterable.stream.skip_while(_source(numbers), func))
+
+    assert result == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("nums", "predicate", "target"),
+    [
+        ([0, 1, 2, 3, 4], lambda x: x < 10, [0, 1, 2, 3, 4]),
+        ([0, 1, 2, 3, 4], lambda x: x < 3, [0, 1, 2]),
+        ([0, 1, 2, 3, 4], lambda x: x > 10, []),
+    ],
+)
+async def test_take_while(
+    nums: list[int], predicate: Callable[[int], int], target: list[int]
+):
+    result = await _collect(iterable.stream.take_while(_source(nums), predicate))
+
+    assert result == target
+
+
+@pytest.mark.asyncio
+async def test_join():
+    result = await _collect(
+        iterable.stream.join(_source([[0], _source([1, 2, 3]), [4, 5]]))
+    )
+
+    assert result == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("size", "target"),
+    [
+        (1, [[0], [1], [2], [3], [4]]),
+        (2, [[0, 1], [2, 3], [4]]),
+        (5, [[0, 1, 2, 3, 4]]),
+        (10, [[0, 1, 2, 3, 4]]),
+    ],
+)
+async def test_batch(size: int, target: list[list[int]]):
+    result = await _collect(iterable.stream.batch(_source([0, 1, 2, 3, 4]), size))
+
+    assert result == target
+
+
+@pytest.mark.asyncio
+async def test_batch_invalid_size():
+    with pytest.raises(ValueError):
+        await _collect(iterable.stream.batch(_source([0, 1]), 0))
+
+
+class _Tracked:
+    def __init__(self, items: list[int]):
+        self.items = items
+        self.closed = False
+
+    async def source(self) -> AsyncIterator[int]:
+        try:
+            for item in self.items:
+                yield item
+        finally:
+            self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_take_while_leaves_source_open():
+    tracked = _Tracked([0, 1, 2, 3, 4])
+    source = tracked.source()
+
+    result = await _collect(iterable.stream.take_while(source, lambda x: x < 2))
+
+    # source is owned by caller, as with `lazy.take_while`
+    assert result == [0, 1]
+    assert not tracked.closed
+    assert await _collect(source) == [3, 4]
+    assert tracked.closed
@@ -1,8 +1,19 @@
+import itertools
+import os
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from inspect import isgenerator
+from typing import Callable, Iterator
+
+import pytest
 
 from tests.iterable.utils import is_even_with_sleep
-from tests.utils import add_with_sleep
-from tibia import iterable
+from tests.utils import add, add_with_sleep, is_even
+from tibia import Empty, Ok, Pipeline, Result, Some, iterable
+from tibia.iterable import threaded
 
 
 def test_map():
@@ -38,3 +49,165 @@ def test_filter():
     result = list(result_gen)
 
     assert set(result) == {0, 2, 4}
+
+
+@pytest.mark.parametrize("func", [iterable.threaded.map, iterable.threaded.filter])
+def test_ordered(func: Callable):
+    delays = [0.05, 0.0, 0.03, 0.0, 0.01, 0.0]
+
+    def sleep_and_return(delay: float) -> float:
+        time.sleep(delay)
+        return delay
+
+    result = list(func(delays, sleep_and_return, max_workers=6, ordered=True))
+
+    if func is iterable.threaded.filter:
+        assert result == [d for d in delays if d]
+    else:
+        assert result == delays
+
+
+def test_inspect_ordered(numbers: list[int]):
+    seen = []
+
+    result = list(iterable.threaded.inspect(numbers, seen.append, ordered=True))
+
+    assert result == numbers
+    assert sorted(seen) == numbers
+
+
+def test_shared_executor(numbers: list[int]):
+    threads = set()
+
+    def add_in_thread(x: int, y: int) -> int:
+        threads.add(threading.current_thread().name)
+        return x + y
+
+    with ThreadPoolExecutor(2, thread_name_prefix="shared") as executor:
+        for _ in range(3):
+            result = list(
+                iterable.threaded.map(
+                    numbers, add_in_thread, 1, executor=executor, ordered=True
+                )
+            )
+
+            assert result == [add(x, 1) for x in numbers]
+
+        # executor is not shut down by the call
+        assert executor.submit(add, 1, 1).result() == 2
+
+    assert all(name.startswith("shared") for name in threads)
+    assert len(threads) <= 2
+
+
+def test_max_workers(numbers: list[int]):
+    threads = set()
+
+    def is_even_in_thread(x: int) -> bool:
+        threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return is_even(x)
+
+    result = list(iterable.threaded.filter(numbers, is_even_in_thread, max_workers=2))
+
+    assert sorted(result) == [x for x in numbers if is_even(x)]
+    assert len(threads) <= 2
+
+
+def test_raises_and_cancels():
+    calls = []
+
+    def fail_on_first(x: int) -> int:
+        calls.append(x)
+        time.sleep(0.01)
+
+        if x == 0:
+            raise ValueError(x)
+
+        return x
+
+    with ThreadPoolExecutor(1) as executor, pytest.raises(ValueError):
+        list(iterable.threaded.map(range(100), fail_on_first, executor=executor))
+
+    assert len(calls) < 100
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_window(ordered: bool):
+    pulled = []
+
+    def source() -> Iterator[int]:
+        for i in itertools.count():
+            pulled.append(i)
+            yield i
+
+    result_gen = iterable.threaded.map(
+        source(), add, 1, max_workers=2, window=4, ordered=ordered
+    )
+    first = next(result_gen)
+    result_gen.close()
+
+    assert first == 1 or not ordered
+    assert len(pulled) <= 5
+
+
+@pytest.mark.parametrize(
+    "func", [iterable.threaded.map, iterable.threaded.inspect, iterable.threaded.filter]
+)
+def test_window_invalid(numbers: list[int], func: Callable):
+    with pytest.raises(ValueError):
+        func(numbers, add, 1, window=0)
+
+
+@pytest.mark.parametrize(("gil_enabled", "workers"), [(True, 12), (False, 8)])
+def test_default_workers(
+    monkeypatch: pytest.MonkeyPatch, gil_enabled: bool, workers: int
+):
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: gil_enabled, raising=False)
+
+    assert threaded._default_workers() == workers
+
+
+def test_stress_shared_executor():
+    def run(offset: int) -> list[int]:
+        return list(
+            iterable.threaded.map(
+                range(2_000), add, offset, executor=executor, ordered=True
+            )
+        )
+
+    with ThreadPoolExecutor(8) as executor, ThreadPoolExecutor(8) as callers:
+        results = list(callers.map(run, range(16)))
+
+    assert results == [[add(x, i) for x in range(2_000)] for i in range(16)]
+
+
+def test_stress_containers():
+    pipeline = Pipeline[int, int]().map(add, 1).map(add, 2)
+
+    def work(x: int) -> tuple:
+        return (
+            Ok(x).map(add, 1).map_err(str).unwrap(),
+            Some(x).map(add, 1).unwrap_or(0),
+            Some(None) is Some(None) and Ok(True) is Ok(True),
+            Empty() is Empty(),
+            hash(Ok(x)) == hash(x),
+            pipeline(x),
+        )
+
+    expected = [work(x) for x in range(20_000)]
+    result = list(
+        iterable.threaded.map(range(20_000), work, max_workers=8, ordered=True)
+    )
+
+    assert result == expected
+
+
+def test_deprecated_wraps_keep_warnings_filters():
+    filters = list(warnings.filters)
+
+    with pytest.warns(DeprecationWarning):
+        Result.wraps(add)
+
+    assert warnings.filters == filters
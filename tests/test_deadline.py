@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from tests.utils import add, add_async
+from tibia import deadline
+from tibia.future import Future
+from tibia.future_result import FutureResult, safe
+from tibia.result import Ok
+from tibia.utils import identity_async
+from tibia.value import Value
+
+
+def test_scope():
+    assert deadline.remaining() is None
+
+    with deadline.scope(10) as outer:
+        assert 9 < deadline.remaining() <= 10
+
+        with deadline.scope(20) as inner:
+            assert inner == outer
+
+        with deadline.scope(1):
+            assert deadline.remaining() <= 1
+
+        assert deadline.remaining() > 1
+
+    assert deadline.remaining() is None
+
+    with deadline.scope(-1):
+        assert deadline.remaining() == 0
+
+
+@pytest.mark.asyncio
+async def test_steps_see_remaining():
+    seen = []
+
+    async def record(x: int) -> int:
+        seen.append(deadline.remaining())
+        return x
+
+    with deadline.scope(1):
+        result = await Value(1).map_async(record).map_async(add_async, 1)
+
+    assert result == 2
+    assert 0 < seen[0] <= 1
+
+
+@pytest.mark.asyncio
+async def test_future():
+    cancelled = []
+
+    async def stuck(x: int) -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+
+        return x  # pragma: no cover
+
+    with deadline.scope(0.05), pytest.raises(TimeoutError):
+        await Future(identity_async(1)).map(add, 1).map_async(stuck)
+
+    with deadline.scope(0.05), pytest.raises(TimeoutError):
+        await Future(stuck(3))
+
+    assert cancelled == [2, 3]
+    assert await Future(identity_async(1)).map_async(add_async, 1) == 2
+
+
+@pytest.mark.asyncio
+async def test_future_result():
+    @safe
+    async def stuck(x: int) -> int:
+        await asyncio.sleep(10)
+        return x  # pragma: no cover
+
+    with deadline.scope(0.05):
+        result = await stuck(1).map(add, 1).map_err(str)
+
+    assert isinstance(result.unwrap_err(), TimeoutError)
+
+    with deadline.scope(0.05):
+        result = await stuck(1)
+
+    assert isinstance(result.unwrap_err(), TimeoutError)
+
+    with deadline.scope(1):
+        result = await FutureResult(identity_async(Ok(1))).map_async(add_async, 1)
+
+    assert result == Ok(2)
+
+
+@pytest.mark.asyncio
+async def test_future_result_own_timeout():
+    async def timeout(x: int) -> int:
+        raise TimeoutError(x)
+
+    with deadline.scope(1), pytest.raises(TimeoutError):
+        await FutureResult(identity_async(Ok(1))).map_async(timeout)
+
+
+@pytest.mark.asyncio
+async def test_future_result_terminal_methods():
+    @safe
+    async def stuck(x: int) -> int:
+        await asyncio.sleep(10)
+        return x  # pragma: no cover
+
+    with deadline.scope(0.01):
+        assert await stuck(1).is_ok() is False
+
+    with deadline.scope(0.01):
+        assert await stuck(1).unwrap_or(0) == 0
+
+    with deadline.scope(0.01):
+        assert await stuck(1).map_or(-1, str) == -1
+
+    with deadline.scope(0.01):
+        assert await stuck(1).unwrap_or(0).map(add, 1) == 1
+
+
+@pytest.mark.asyncio
+async def test_future_result_terminal_steps_bounded():
+    async def stuck(x: int) -> int:
+        await asyncio.sleep(10)
+        return x  # pragma: no cover
+
+    with deadline.scope(0.05), pytest.raises(TimeoutError):
+        await FutureResult(identity_async(Ok(1))).unwrap().map_async(stuck)
@@ -66,3 +66,36 @@ async def test_wraps():
 
     assert isinstance(result, Future)
     assert await result.unwrap() == await add_async(x, y)
+
+
+@pytest.mark.asyncio
+async def test_unwrap_without_steps():
+    awaitable = add_async(1, 1)
+
+    assert Future(awaitable).unwrap() is awaitable
+    assert await awaitable == 2
+
+
+@pytest.mark.asyncio
+async def test_long_chain():
+    future = Value(0).map_async(add_async, 1)
+
+    for _ in range(1000):
+        future = future.map(add, 1).inspect(add, 1)
+
+    assert await future == 1001
+
+
+@pytest.mark.asyncio
+async def test_branching_chain():
+    visited = []
+
+    async def visit(value: int) -> None:
+        visited.append(value)
+
+    base = Future(add_async(0, 1)).map(add, 1)
+    result = await base.inspect_async(visit).map_async(add_async, 1)
+
+    assert result == 3
+    assert visited == [2]
+    assert base.map(add, 10)._steps[1] is base._steps
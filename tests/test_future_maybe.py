@@ -3,7 +3,7 @@ from typing import Any, Awaitable, Callable
 import pytest
 
 from tests.utils import add, add_async, get_async, is_even, is_even_async, set_async
-from tibia import mapping
+from tibia import future_maybe, mapping
 from tibia.future_maybe import FutureMaybe, safe, wraps
 from tibia.maybe import Empty, Maybe, Some
 from tibia.utils import identity_async
@@ -305,7 +305,8 @@ async def test_inspect_async(maybe: Maybe[dict], target: dict | None):
     ],
 )
 async def test_wraps(data: dict, target: Maybe[str | None]):
-    maybe_get = FutureMaybe.wraps(get_async)
+    with pytest.warns(DeprecationWarning):
+        maybe_get = FutureMaybe.wraps(get_async)
     maybe_get_new = wraps(get_async)
 
     assert (
@@ -322,9 +323,60 @@ async def test_wraps(data: dict, target: Maybe[str | None]):
     ],
 )
 async def test_wraps_optional(data: dict, target: Maybe[str | None]):
-    maybe_get = FutureMaybe.wraps_optional(get_async)
+    with pytest.warns(DeprecationWarning):
+        maybe_get = FutureMaybe.wraps_optional(get_async)
     maybe_get_new = safe(get_async)
 
     assert (
         (await maybe_get(data, "key")) == (await maybe_get_new(data, "key")) == target
     )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("maybe", [Some(1), Empty()])
+async def test_point_free(maybe: Maybe[int]):
+    def fm() -> FutureMaybe[int]:
+        return FutureMaybe(identity_async(maybe))
+
+    assert await future_maybe.map(fm(), add, 1) == maybe.map(add, 1)
+    assert await future_maybe.map_async(fm(), add_async, 1) == maybe.map(add, 1)
+    assert await future_maybe.inspect(fm(), add, 1) == maybe
+    assert await future_maybe.inspect_async(fm(), add_async, 1) == maybe
+
+
+@pytest.mark.asyncio
+async def test_short_circuit():
+    calls = []
+
+    def fail(x: int) -> int:
+        raise AssertionError("must not be called")
+
+    result = (
+        await FutureMaybe(identity_async(Some(1)))
+        .map(add, 1)
+        .inspect(calls.append)
+        .map(lambda _: Empty())
+        .inspect(calls.append)
+    )
+
+    assert result == Some(Empty())
+
+    result = (
+        await FutureMaybe(identity_async(Empty()))
+        .map(fail)
+        .map_async(add_async, 1)
+        .inspect(fail)
+    )
+
+    assert result is Empty()
+    assert calls == [2, Empty()]
+
+
+@pytest.mark.asyncio
+async def test_long_chain():
+    fm = FutureMaybe(identity_async(Some(0)))
+
+    for _ in range(1000):
+        fm = fm.map(add, 1)
+
+    assert await fm == Some(1000)
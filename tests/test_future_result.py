@@ -4,9 +4,9 @@ from typing import Any
 import pytest
 
 from tests.utils import add, add_async, is_even, is_even_async, set_async
-from tibia import mapping
+from tibia import future_result, mapping
 from tibia.future_result import FutureResult, safe, safe_from, wraps
-from tibia.result import Err, Ok, Result
+from tibia.result import Err, ErrorRecord, Ok, Result
 from tibia.utils import identity_async
 
 
@@ -427,7 +427,8 @@ async def test_inspect_err_async(result: Result[int, int], default: int, target:
 
 @pytest.mark.asyncio
 async def test_wraps():
-    wraps_add = FutureResult.wraps(add_async)
+    with pytest.warns(DeprecationWarning):
+        wraps_add = FutureResult.wraps(add_async)
 
     result = await wraps_add(1, 1)
 
@@ -444,11 +445,13 @@ async def test_wraps():
     ],
 )
 async def test_safe(exceptions: list[Exception]):
-    @FutureResult.safe(*exceptions)
-    async def safe_get_key(d: dict, k: Any) -> Any:
-        await asyncio.sleep(0.05)
+    with pytest.warns(DeprecationWarning):
 
-        return d[k]
+        @FutureResult.safe(*exceptions)
+        async def safe_get_key(d: dict, k: Any) -> Any:
+            await asyncio.sleep(0.05)
+
+            return d[k]
 
     result = safe_get_key({}, "key")
 
@@ -499,3 +502,192 @@ async def test_safe_new():
 
     err = await result.expect_err("KeyError")
     assert isinstance(err, KeyError)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("result", [Ok(1), Err(1)])
+async def test_point_free(result: Result[int, int]):
+    def fr() -> FutureResult[int, int]:
+        return FutureResult(identity_async(result))
+
+    assert await future_result.map(fr(), add, 1) == result.map(add, 1)
+    assert await future_result.map_async(fr(), add_async, 1) == result.map(add, 1)
+    assert await future_result.inspect(fr(), add, 1) == result
+    assert await future_result.inspect_async(fr(), add_async, 1) == result
+    assert await future_result.map_err(fr(), add, 1) == result.map_err(add, 1)
+    assert await future_result.map_err_async(fr(), add_async, 1) == result.map_err(
+        add, 1
+    )
+    assert await future_result.inspect_err(fr(), add, 1) == result
+    assert await future_result.inspect_err_async(fr(), add_async, 1) == result
+
+
+@pytest.mark.asyncio
+async def test_short_circuit():
+    calls = []
+
+    def fail(x: int) -> int:
+        raise AssertionError("must not be called")
+
+    async def fail_async(x: int) -> int:
+        raise AssertionError("must not be called")
+
+    result = (
+        await FutureResult(identity_async(Ok(1)))
+        .map(add, 1)
+        .inspect(calls.append)
+        .map_err(fail)
+        .map(lambda _: Err(0)._internal)
+        .map(lambda x: x)
+        .inspect(calls.append)
+    )
+    assert result == Ok(0)
+
+    result = (
+        await FutureResult(identity_async(Err(1)))
+        .map(fail)
+        .map_async(fail_async)
+        .inspect_err(calls.append)
+        .map_err_async(add_async, 1)
+        .map(fail)
+        .inspect_async(fail_async)
+    )
+
+    assert result == Err(2)
+    assert isinstance(result, Err)
+    assert calls == [2, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_long_chain():
+    fr = FutureResult(identity_async(Ok(0)))
+
+    for _ in range(1000):
+        fr = fr.map(add, 1).map_err(add, 1)
+
+    assert await fr == Ok(1000)
+
+
+@pytest.mark.asyncio
+async def test_safe_from_record():
+    @safe_from(KeyError, record=True, with_traceback=True)
+    async def safe_get_key(d: dict, k: Any) -> Any:
+        return d[k]
+
+    err = await safe_get_key({}, "key").unwrap_err()
+
+    assert isinstance(err, ErrorRecord)
+    assert err.type is KeyError
+    assert err.stack[-1][2] == "safe_get_key"
+
+
+class _Replicas:
+    def __init__(self, *delays: float, fail: bool = False):
+        self.delays = list(delays)
+        self.calls = 0
+        self.cancelled = 0
+        self.fail = fail
+
+    @safe
+    async def fetch(self, x: int) -> int:
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+        if self.fail:
+            raise ValueError(delay)
+
+        return x + int(delay * 100)
+
+
+@pytest.mark.asyncio
+async def test_hedge_fast_primary():
+    replicas = _Replicas(0)
+
+    result = await future_result.hedge(0.05, max_ratio=1)(replicas.fetch)(1)
+
+    assert result == Ok(1)
+    assert replicas.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_slow_primary():
+    replicas = _Replicas(1, 0)
+
+    start = asyncio.get_running_loop().time()
+    result = await future_result.hedge(0.05, max_ratio=1)(replicas.fetch)(1)
+
+    assert result == Ok(1)
+    assert replicas.calls == 2
+    assert asyncio.get_running_loop().time() - start < 0.5
+
+    await asyncio.sleep(0)
+    assert replicas.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_primary_wins_race():
+    replicas = _Replicas(0.1, 1)
+
+    result = await future_result.hedge(0.05, max_ratio=1)(replicas.fetch)(1)
+
+    assert result == Ok(11)
+    assert replicas.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_hedge_both_fail():
+    replicas = _Replicas(0.1, 0.01, fail=True)
+
+    result = await future_result.hedge(0.05, max_ratio=1)(replicas.fetch)(1)
+
+    # hedge fails first
+    assert result.unwrap_err().args == (0.01,)
+    assert replicas.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget():
+    replicas = _Replicas(0.02)
+    fetch = future_result.hedge(0.01, max_ratio=0.5)(replicas.fetch)
+
+    for _ in range(4):
+        await fetch(1)
+
+    # every second call may be hedged
+    assert replicas.calls == 6
+
+
+@pytest.mark.asyncio
+async def test_hedge_default_budget():
+    replicas = _Replicas(0.01)
+    fetch = future_result.hedge(0)(replicas.fetch)
+
+    for _ in range(20):
+        await fetch(1)
+
+    # every tenth call may be hedged
+    assert replicas.calls == 22
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_not_saved_up():
+    replicas = _Replicas(0, 0, 0, 0, 0.01)
+    fetch = future_result.hedge(0.005, max_ratio=0.5)(replicas.fetch)
+
+    for _ in range(6):
+        await fetch(1)
+
+    # four fast calls earn a single hedge
+    assert replicas.calls == 7
+
+
+@pytest.mark.parametrize(("delay", "max_ratio"), [(-1, 0.1), (1, 2)])
+def test_hedge_invalid(delay: float, max_ratio: float):
+    with pytest.raises(ValueError):
+        future_result.hedge(delay, max_ratio)
@@ -1,10 +1,28 @@
+import copy
+import inspect
+import dataclasses
+import pickle
+import sys
+from inspect import isgenerator
 from typing import Any, Awaitable, Callable
 
 import pytest
 
 from tests.utils import add, add_async, is_even, is_even_async, set_async
 from tibia import mapping
-from tibia.maybe import Empty, Maybe, Some, match_some, safe, wraps
+from tibia import maybe as maybe_
+from tibia.maybe import (
+    Empty,
+    Maybe,
+    Some,
+    compact,
+    filter_map,
+    iterate_filter_map,
+    iterate_some,
+    match_some,
+    safe,
+    wraps,
+)
 
 
 @pytest.mark.parametrize(
@@ -265,7 +283,8 @@ async def test_inspect_async(maybe: Maybe[dict], target: dict | None):
     ],
 )
 def test_wraps(data: dict, target: Maybe[str | None]):
-    maybe_get = Maybe.wraps(dict.get)
+    with pytest.warns(DeprecationWarning):
+        maybe_get = Maybe.wraps(dict.get)
     maybe_get_new = wraps(dict.get)
 
     assert maybe_get(data, "key") == maybe_get_new(data, "key") == target
@@ -279,7 +298,8 @@ def test_wraps(data: dict, target: Maybe[str | None]):
     ],
 )
 def test_wraps_optional(data: dict, target: Maybe[str | None]):
-    maybe_get = Maybe.wraps_optional(dict.get)
+    with pytest.warns(DeprecationWarning):
+        maybe_get = Maybe.wraps_optional(dict.get)
     maybe_get_new = safe(dict.get)
 
     assert maybe_get(data, "key") == maybe_get_new(data, "key") == target
@@ -312,3 +332,124 @@ def test_match_ok(fns: list[Callable[[int], Maybe[int]]], is_some: bool):
     m = match_some(*fns)(0)
 
     assert m.is_some() == is_some
+
+
+def test_empty_singleton():
+    empty = Empty()
+
+    assert empty is Empty()
+    assert empty is Maybe.from_optional(None)
+    assert copy.copy(empty) is empty
+    assert pickle.loads(pickle.dumps(empty)) is empty
+    assert empty == Empty()
+    assert empty != Some(None)
+
+
+def test_compact():
+    maybes = [Some(0), Empty(), Some(None), Empty(), Some(2)]
+
+    assert compact(maybes) == [0, None, 2]
+    assert isgenerator(iterate_some(maybes))
+    assert list(iterate_some(maybes)) == [0, None, 2]
+
+
+def test_filter_map():
+    numbers = [0, 1, 2, 3, 4]
+
+    result_gen = iterate_filter_map(numbers, Maybe.from_value_when, is_even)
+
+    assert isgenerator(result_gen)
+    assert list(result_gen) == [0, 2, 4]
+    assert filter_map(numbers, Maybe.from_value_when, is_even) == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("m", [Some(1), Empty()])
+async def test_point_free(m: Maybe[int]):
+    assert maybe_.map(m, add, 1) == m.map(add, 1)
+    assert maybe_.inspect(m, add, 1) == m
+    assert await maybe_.map_async(m, add_async, 1) == m.map(add, 1)
+    assert await maybe_.inspect_async(m, add_async, 1) == m
+
+
+def test_hashable():
+    assert {Some(1), Some(1), Empty(), Empty()} == {Some(1), Empty()}
+    assert {Some("a"): 1}[Some("a")] == 1
+    assert hash(Some((1, 2))) == hash((1, 2))
+    assert hash(Empty()) == hash(Empty())
+
+
+def test_frozen():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        Some(1)._internal = 2
+
+
+class _OneSlot:
+    __slots__ = ("_internal",)
+
+
+class _NoSlots:
+    __slots__ = ()
+
+
+def test_slots_only():
+    assert not hasattr(Some(1), "__dict__")
+    assert not hasattr(Empty(), "__dict__")
+    assert sys.getsizeof(Some(1)) == sys.getsizeof(_OneSlot())
+    assert sys.getsizeof(Empty()) == sys.getsizeof(_NoSlots())
+
+    with pytest.raises(AttributeError):
+        Empty()._internal = 1
+
+
+@pytest.mark.parametrize("value", [None, True, False])
+def test_interned(value: Any):
+    assert Some(value) is Some(value)
+    assert Some(value).unwrap() is value
+    assert Maybe.from_value(value) is Some(value)
+    assert copy.copy(Some(value)) is Some(value)
+    assert pickle.loads(pickle.dumps(Some(value))) is Some(value)
+    assert Some(1) is not Some(1)
+    assert pickle.loads(pickle.dumps(Some([1]))) == Some([1])
+
+
+async def _outcome(call: Callable[[], Any]) -> Any:
+    try:
+        value = call()
+
+        if inspect.isawaitable(value):
+            value = await value
+    except Exception as exc:
+        return type(exc)
+
+    return value
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("container", [Some(2), Empty()])
+@pytest.mark.parametrize(
+    ("name", "args"),
+    [
+        ("is_empty", ()),
+        ("is_empty_or", (is_even,)),
+        ("is_empty_or_async", (is_even_async,)),
+        ("is_some", ()),
+        ("is_some_and", (is_even,)),
+        ("is_some_and_async", (is_even_async,)),
+        ("expect", ("value",)),
+        ("unwrap", ()),
+        ("unwrap_or", (0,)),
+        ("unwrap_or_none", ()),
+        ("map", (add, 1)),
+        ("map_async", (add_async, 1)),
+        ("map_or", (0, add, 1)),
+        ("map_or_async", (0, add_async, 1)),
+        ("inspect", (is_even,)),
+        ("inspect_async", (is_even_async,)),
+    ],
+)
+async def test_base_methods(container: Maybe[int], name: str, args: tuple):
+    # base methods forward to module functions, subclasses specialize them
+    base = await _outcome(lambda: getattr(Maybe, name)(container, *args))
+
+    assert base == await _outcome(lambda: getattr(container, name)(*args))
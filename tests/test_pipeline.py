@@ -0,0 +1,56 @@
+from inspect import isfunction
+
+from tests.utils import add
+from tibia import iterable, mapping
+from tibia.pipeline import Pipeline
+from tibia.value import Value
+
+
+def test_call():
+    pipeline = Pipeline[int, int]().map(add, 1).map(add, y=2).map(str)
+
+    assert pipeline(1) == "4"
+    assert pipeline(1) == Value(1).map(add, 1).map(add, y=2).map(str).unwrap()
+
+
+def test_empty():
+    obj = object()
+
+    assert Pipeline()(obj) is obj
+    assert Pipeline().apply([1, 2]) == [1, 2]
+
+
+def test_inspect():
+    key, value = "key", "value"
+    pipeline = Pipeline[dict, dict]().inspect(mapping.value.set, key, value)
+
+    assert pipeline({}) == {key: value}
+
+
+def test_reusable():
+    base = Pipeline[int, int]().map(add, 1)
+    doubled = base.map(lambda x: x * 2)
+
+    assert base(1) == 2
+    assert doubled(1) == 4
+    assert base(2) == 3
+
+
+def test_compile():
+    pipeline = Pipeline[int, int]().map(add, 1)
+    compiled = pipeline.compile()
+
+    assert isfunction(compiled)
+    assert compiled is pipeline.compile()
+    assert compiled(1) == 2
+
+
+def test_apply():
+    numbers = list(range(10))
+    visited = []
+    pipeline = Pipeline[int, int]().inspect(visited.append).map(add, 1)
+
+    result = pipeline.apply(iter(numbers))
+
+    assert result == iterable.map(numbers, add, 1)
+    assert visited == numbers
@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+import pytest
+
+from tests.utils import add, add_async, is_even, is_even_async
+from tibia import iterable
+from tibia.rate_limiter import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_acquire():
+    limiter = RateLimiter(50, burst=5)
+    start = time.monotonic()
+
+    for _ in range(10):
+        await limiter.acquire()
+
+    # 5 tokens are available immediately, other 5 come at 50 per second
+    assert 0.09 <= time.monotonic() - start < 0.3
+
+
+@pytest.mark.asyncio
+async def test_shared_between_tasks():
+    limiter = RateLimiter(100)
+    stamps = []
+
+    async def worker():
+        for _ in range(5):
+            async with limiter:
+                stamps.append(time.monotonic())
+
+    await asyncio.gather(*[worker() for _ in range(4)])
+
+    assert len(stamps) == 20
+    assert stamps[-1] - stamps[0] >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_aio():
+    numbers = list(range(10))
+    limiter = RateLimiter(200)
+    start = time.monotonic()
+
+    assert await iterable.aio.map(numbers, add_async, 1, rate_limiter=limiter) == [
+        add(x, 1) for x in numbers
+    ]
+    assert await iterable.aio.map(
+        numbers, add_async, 1, max_concurrency=2, rate_limiter=limiter
+    ) == [add(x, 1) for x in numbers]
+    assert await iterable.aio.filter(numbers, is_even_async, rate_limiter=limiter) == [
+        x for x in numbers if is_even(x)
+    ]
+    assert (
+        await iterable.aio.inspect(numbers, is_even_async, rate_limiter=limiter)
+        == numbers
+    )
+    assert await iterable.aio.group_by(
+        numbers, is_even_async, rate_limiter=limiter
+    ) == {True: [0, 2, 4, 6, 8], False: [1, 3, 5, 7, 9]}
+
+    assert [
+        x
+        async for x in iterable.aio.imap(
+            numbers, add_async, 1, max_concurrency=4, rate_limiter=limiter
+        )
+    ] == [add(x, 1) for x in numbers]
+
+    # 60 calls in total, 1 is free
+    assert time.monotonic() - start >= 59 / 200
+
+
+@pytest.mark.parametrize(("rate", "burst"), [(0, 1), (1, 0)])
+def test_invalid(rate: float, burst: int):
+    with pytest.raises(ValueError):
+        RateLimiter(rate, burst)
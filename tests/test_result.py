@@ -1,10 +1,33 @@
+import copy
+import inspect
+import dataclasses
+import functools
+import pickle
+import sys
+import weakref
+from inspect import isgenerator
 from typing import Any, Callable, Iterable
 
 import pytest
 
 from tests.utils import add, add_async, is_even, is_even_async, set_async
 from tibia import mapping
-from tibia.result import Err, Ok, Result, match_ok, safe, safe_from, safe_iterate, wraps
+from tibia import result as result_
+from tibia.result import (
+    Err,
+    ErrorRecord,
+    Ok,
+    Result,
+    collect,
+    iterate_err,
+    iterate_ok,
+    match_ok,
+    partition,
+    safe,
+    safe_from,
+    safe_iterate,
+    wraps,
+)
 
 
 @pytest.mark.parametrize(
@@ -359,7 +382,8 @@ async def test_inspect_err_async(result: Result[int, int], default: int, target:
 
 
 def test_wraps():
-    wraps_add = Result.wraps(add)
+    with pytest.warns(DeprecationWarning):
+        wraps_add = Result.wraps(add)
 
     result = wraps_add(1, 1)
 
@@ -375,9 +399,11 @@ def test_wraps():
     ],
 )
 def test_safe(exceptions: list[Exception]):
-    @Result.safe(*exceptions)
-    def safe_get_key(d: dict, k: Any) -> Any:
-        return d[k]
+    with pytest.warns(DeprecationWarning):
+
+        @Result.safe(*exceptions)
+        def safe_get_key(d: dict, k: Any) -> Any:
+            return d[k]
 
     result = safe_get_key({}, "key")
 
@@ -470,3 +496,216 @@ def test_safe_iterate():
     assert isinstance(items[0], Ok)
     assert items[0].unwrap() == 1
     assert isinstance(items[1], Err)
+
+
+def test_partition():
+    oks, errs = partition([Ok(0), Err("a"), Ok(1), Err("b")])
+
+    assert oks == [0, 1]
+    assert errs == ["a", "b"]
+
+
+@pytest.mark.parametrize(
+    ("results", "target"),
+    [
+        ([Ok(0), Ok(1), Ok(2)], Ok([0, 1, 2])),
+        ([], Ok([])),
+        ([Ok(0), Err("a"), Err("b")], Err("a")),
+    ],
+)
+def test_collect(results: list[Result[int, str]], target: Result[list[int], str]):
+    assert collect(results) == target
+
+
+def test_collect_stops_at_err():
+    def gen() -> Iterable[Result[int, str]]:
+        yield Ok(0)
+        yield Err("a")
+        raise AssertionError("must not be reached")
+
+    assert collect(gen()) == Err("a")
+
+
+def test_iterate_ok_err():
+    results = [Ok(0), Err("a"), Ok(1), Err("b")]
+
+    assert isgenerator(iterate_ok(results))
+    assert list(iterate_ok(results)) == [0, 1]
+    assert isgenerator(iterate_err(results))
+    assert list(iterate_err(results)) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("r", [Ok(1), Err(1)])
+async def test_point_free(r: Result[int, int]):
+    assert result_.map(r, add, 1) == r.map(add, 1)
+    assert result_.inspect(r, add, 1) == r
+    assert result_.map_err(r, add, 1) == r.map_err(add, 1)
+    assert result_.inspect_err(r, add, 1) == r
+    assert await result_.map_async(r, add_async, 1) == r.map(add, 1)
+    assert await result_.inspect_async(r, add_async, 1) == r
+    assert await result_.map_err_async(r, add_async, 1) == r.map_err(add, 1)
+    assert await result_.inspect_err_async(r, add_async, 1) == r
+
+
+class _Payload:
+    pass
+
+
+@pytest.mark.parametrize(
+    ("record", "is_retained"),
+    [
+        (False, True),
+        (True, False),
+    ],
+)
+def test_safe_from_record(record: bool, is_retained: bool):
+    refs = []
+
+    @safe_from(KeyError, record=record)
+    def fail() -> None:
+        payload = _Payload()
+        refs.append(weakref.ref(payload))
+        raise KeyError("key")
+
+    result = fail()
+
+    assert result.is_err()
+    assert (refs[0]() is not None) is is_retained
+
+
+def test_error_record():
+    @safe_from(record=True)
+    def fail() -> None:
+        raise ValueError("message")
+
+    err = fail().unwrap_err()
+
+    assert isinstance(err, ErrorRecord)
+    assert err.type is ValueError
+    assert err.message == "message"
+    assert str(err) == "ValueError: message"
+    assert err.stack is None
+    assert err.format_traceback() == ""
+
+
+def test_error_record_with_traceback():
+    @safe_from(record=True, with_traceback=True)
+    def fail() -> None:
+        raise ValueError("message")
+
+    err = fail().unwrap_err()
+
+    assert err.stack is not None
+    assert err.stack[-1][2] == "fail"
+    assert 'raise ValueError("message")' in err.format_traceback()
+
+
+def test_hashable():
+    assert {Ok(1), Ok(1), Ok(2)} == {Ok(1), Ok(2)}
+    assert {Err("a"): 1}[Err("a")] == 1
+    assert hash(Ok((1, 2))) == hash(Ok((1, 2))) == hash((1, 2))
+    assert hash(Err("a")) == hash("a")
+    assert len({Ok(1), Err(1)}) == 2
+
+
+def test_lru_cache():
+    calls = []
+
+    @functools.lru_cache
+    def cached(result: Result[int, str]) -> Result[int, str]:
+        calls.append(result)
+        return result.map(add, 1)
+
+    assert cached(Ok(1)) == Ok(2)
+    assert cached(Ok(1)) == Ok(2)
+    assert cached(Err("a")) == Err("a")
+    assert calls == [Ok(1), Err("a")]
+
+
+@pytest.mark.parametrize("result", [Ok(1), Err(1)])
+def test_frozen(result: Result[int, int]):
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result._internal = 2
+
+
+class _OneSlot:
+    __slots__ = ("_internal",)
+
+
+@pytest.mark.parametrize("result", [Ok(1), Err(1)])
+def test_slots_only(result: Result[int, int]):
+    assert not hasattr(result, "__dict__")
+    assert sys.getsizeof(result) == sys.getsizeof(_OneSlot())
+
+
+@pytest.mark.parametrize("value", [None, True, False])
+def test_interned(value: Any):
+    assert Ok(value) is Ok(value)
+    assert Ok(value).unwrap() is value
+    assert copy.copy(Ok(value)) is Ok(value)
+    assert pickle.loads(pickle.dumps(Ok(value))) is Ok(value)
+    assert Ok(1) is not Ok(1)
+    assert Err(None) is not Err(None)
+
+
+def test_pickle():
+    result = pickle.loads(pickle.dumps(Ok([1, 2])))
+
+    assert isinstance(result, Ok)
+    assert result == Ok([1, 2])
+    assert dataclasses.replace(Ok(1), _internal=2) == Ok(2)
+
+
+async def _outcome(call: Callable[[], Any]) -> Any:
+    try:
+        value = call()
+
+        if inspect.isawaitable(value):
+            value = await value
+    except Exception as exc:
+        return type(exc)
+
+    return value
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("container", [Ok(2), Err(3)])
+@pytest.mark.parametrize(
+    ("name", "args"),
+    [
+        ("is_ok", ()),
+        ("is_ok_and", (is_even,)),
+        ("is_ok_and_async", (is_even_async,)),
+        ("is_ok_or", (is_even,)),
+        ("is_ok_or_async", (is_even_async,)),
+        ("expect", ("value",)),
+        ("unwrap", ()),
+        ("unwrap_or", (0,)),
+        ("map", (add, 1)),
+        ("map_async", (add_async, 1)),
+        ("map_or", (0, add, 1)),
+        ("map_or_async", (0, add_async, 1)),
+        ("inspect", (is_even,)),
+        ("inspect_async", (is_even_async,)),
+        ("is_err", ()),
+        ("is_err_and", (is_even,)),
+        ("is_err_and_async", (is_even_async,)),
+        ("is_err_or", (is_even,)),
+        ("is_err_or_async", (is_even_async,)),
+        ("expect_err", ("error",)),
+        ("unwrap_err", ()),
+        ("unwrap_err_or", (0,)),
+        ("map_err", (add, 1)),
+        ("map_err_async", (add_async, 1)),
+        ("map_err_or", (0, add, 1)),
+        ("map_err_or_async", (0, add_async, 1)),
+        ("inspect_err", (is_even,)),
+        ("inspect_err_async", (is_even_async,)),
+    ],
+)
+async def test_base_methods(container: Result[int, int], name: str, args: tuple):
+    # base methods forward to module functions, subclasses specialize them
+    base = await _outcome(lambda: getattr(Result, name)(container, *args))
+
+    assert base == await _outcome(lambda: getattr(container, name)(*args))
@@ -2,7 +2,9 @@ from .future import Future
 from .future_maybe import FutureMaybe
 from .future_result import FutureResult
 from .maybe import Empty, Maybe, Some
+from .pipeline import Pipeline
 from .predicate import all_, any_, not_, where
+from .rate_limiter import RateLimiter
 from .result import Err, Ok, Result
 from .value import Value
 
@@ -13,6 +15,8 @@ __all__ = (
     "Empty",
     "Maybe",
     "Some",
+    "Pipeline",
+    "RateLimiter",
     "all_",
     "any_",
     "not_",
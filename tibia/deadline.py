@@ -0,0 +1,32 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_deadline: ContextVar[float | None] = ContextVar("tibia_deadline", default=None)
+
+
+@contextmanager
+def scope(seconds: float) -> Iterator[float]:
+    when = time.monotonic() + seconds
+    outer = _deadline.get()
+
+    # nested scope can only shorten the budget of the enclosing one
+    if outer is not None and outer < when:
+        when = outer
+
+    token = _deadline.set(when)
+
+    try:
+        yield when
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    when = _deadline.get()
+
+    if when is None:
+        return None
+
+    return max(when - time.monotonic(), 0.0)
@@ -1,19 +1,44 @@
 from __future__ import annotations
 
+import asyncio
 import functools
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Concatenate
 
+from tibia import deadline
+from tibia.utils import identity_async, unroll
+
+# (fn, args, kwargs, is_async, keeps_value)
+type _Step = tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any], bool, bool]
+
 
 @dataclass(slots=True)
 class Future[T]:
-    _internal: Awaitable[T]
+    _internal: Awaitable[Any]
+    # steps are recorded as `(last, (previous, ...))` and run in one coroutine
+    _steps: tuple[_Step, Any] | None = None
+    # awaitable applies the deadline on its own (e.g. `FutureResult` resolving
+    # to `Err(TimeoutError)`), so only the steps are bounded here
+    _bounded: bool = False
 
     def __await__(self):
-        return self._internal.__await__()
+        return self.unwrap().__await__()
 
     def unwrap(self) -> Awaitable[T]:
-        return self._internal
+        remaining = deadline.remaining()
+
+        if remaining is not None:
+            return _run_until(
+                self._internal, unroll(self._steps), remaining, self._bounded
+            )
+
+        if self._steps is None:
+            return self._internal
+
+        return _run(self._internal, unroll(self._steps))
+
+    def _then(self, step: _Step) -> Future[Any]:
+        return Future(self._internal, (step, self._steps), self._bounded)
 
     def map[**P, R](
         self,
@@ -21,15 +46,7 @@ class Future[T]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[R]:
-        @functools.wraps(func)
-        async def _map(
-            value: Awaitable[T],
-            *args: P.args,
-            **kwargs: P.kwargs,
-        ) -> R:
-            return func(await value, *args, **kwargs)
-
-        return Future(_map(self._internal, *args, **kwargs))
+        return self._then((func, args, kwargs, False, False))
 
     def map_async[**P, R](
         self,
@@ -37,15 +54,7 @@ class Future[T]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[R]:
-        @functools.wraps(func)
-        async def _map_async(
-            value: Awaitable[T],
-            *args: P.args,
-            **kwargs: P.kwargs,
-        ) -> R:
-            return await func(await value, *args, **kwargs)
-
-        return Future(_map_async(self._internal, *args, **kwargs))
+        return self._then((func, args, kwargs, True, False))
 
     def inspect[**P](
         self,
@@ -53,17 +62,7 @@ class Future[T]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[T]:
-        @functools.wraps(func)
-        async def _inspect(
-            value: Awaitable[T],
-            *args: P.args,
-            **kwargs: P.kwargs,
-        ) -> T:
-            _value = await value
-            func(_value, *args, **kwargs)
-            return _value
-
-        return Future(_inspect(self._internal, *args, **kwargs))
+        return self._then((func, args, kwargs, False, True))
 
     def inspect_async[**P](
         self,
@@ -71,17 +70,7 @@ class Future[T]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[T]:
-        @functools.wraps(func)
-        async def _inspect_async(
-            value: Awaitable[T],
-            *args: P.args,
-            **kwargs: P.kwargs,
-        ) -> T:
-            _value = await value
-            await func(_value, *args, **kwargs)
-            return _value
-
-        return Future(_inspect_async(self._internal, *args, **kwargs))
+        return self._then((func, args, kwargs, True, True))
 
     @staticmethod
     def wraps[**P, R](func: Callable[P, Awaitable[R]]) -> Callable[P, Future[R]]:
@@ -93,3 +82,32 @@ class Future[T]:
             return Future(func(*args, **kwargs))
 
         return _wraps
+
+
+async def _run(value: Awaitable[Any], steps: list[_Step]) -> Any:
+    _value = await value
+
+    for func, args, kwargs, is_async, keeps_value in steps:
+        result = func(_value, *args, **kwargs)
+
+        if is_async:
+            result = await result
+
+        if not keeps_value:
+            _value = result
+
+    return _value
+
+
+async def _run_until(
+    value: Awaitable[Any],
+    steps: list[_Step],
+    remaining: float,
+    bounded: bool,
+) -> Any:
+    if bounded:
+        value = identity_async(await value)
+        remaining = deadline.remaining()
+
+    async with asyncio.timeout(remaining):
+        return await _run(value, steps)
@@ -7,14 +7,27 @@ from typing import Any, Awaitable, Callable, Concatenate
 
 from tibia import maybe as m
 from tibia.future import Future
+from tibia.utils import unroll
+
+
+# (fn, args, kwargs, is_async, keeps_value)
+type _Step = tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any], bool, bool]
 
 
 @dataclass(slots=True)
 class FutureMaybe[T]:
-    _internal: Awaitable[m.Maybe[T]]
+    _internal: Awaitable[m.Maybe[Any]]
+    # steps are recorded as `(last, (previous, ...))` and run in one coroutine
+    _steps: tuple[_Step, Any] | None = None
 
     def __await__(self):
-        return self._internal.__await__()
+        if self._steps is None:
+            return self._internal.__await__()
+
+        return _run(self._internal, unroll(self._steps)).__await__()
+
+    def _then(self, step: _Step) -> FutureMaybe[Any]:
+        return FutureMaybe(self._internal, (step, self._steps))
 
     @staticmethod
     def from_value[I](value: Awaitable[I]) -> FutureMaybe[I]:
@@ -98,7 +111,7 @@ class FutureMaybe[T]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureMaybe[R]:
-        return FutureMaybe(map(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, False, False))
 
     def map_async[**P, R](
         self,
@@ -106,7 +119,7 @@ class FutureMaybe[T]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureMaybe[R]:
-        return FutureMaybe(map_async(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, True, False))
 
     def map_or[**P, R](
         self,
@@ -132,7 +145,7 @@ class FutureMaybe[T]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureMaybe[T]:
-        return FutureMaybe(inspect(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, False, True))
 
     def inspect_async[**P](
         self,
@@ -140,17 +153,16 @@ class FutureMaybe[T]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureMaybe[T]:
-        return FutureMaybe(inspect_async(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, True, True))
 
     @staticmethod
     def wraps[**P, R](fn: Callable[P, Awaitable[R]]) -> Callable[P, FutureMaybe[R]]:
-        warnings.simplefilter("always", DeprecationWarning)
         warnings.warn(
             "FutureMaybe.wraps will be deprecated in tibia@3.0.0, "
             "use future_maybe.wraps instead",
             DeprecationWarning,
+            stacklevel=2,
         )
-        warnings.simplefilter("default", DeprecationWarning)
 
         @functools.wraps(fn)
         def _wraps(*args: P.args, **kwargs: P.kwargs) -> FutureMaybe[R]:
@@ -162,13 +174,12 @@ class FutureMaybe[T]:
     def wraps_optional[**P, R](
         fn: Callable[P, Awaitable[R | None]],
     ) -> Callable[P, FutureMaybe[R]]:
-        warnings.simplefilter("always", DeprecationWarning)
         warnings.warn(
             "FutureMaybe.wraps_optional will be deprecated in tibia@3.0.0, "
             "use future_maybe.safe instead",
             DeprecationWarning,
+            stacklevel=2,
         )
-        warnings.simplefilter("default", DeprecationWarning)
 
         @functools.wraps(fn)
         def _wraps_optional(*args: P.args, **kwargs: P.kwargs) -> FutureMaybe[R]:
@@ -204,7 +215,7 @@ async def from_optional_when[T, **P](
 
 
 async def is_empty[T](fm: FutureMaybe[T]) -> bool:
-    return m.is_empty(await fm._internal)
+    return m.is_empty(await fm)
 
 
 async def is_empty_or[T, **P](
@@ -213,7 +224,7 @@ async def is_empty_or[T, **P](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> bool:
-    return m.is_empty_or(await fm._internal, fn, *args, **kwargs)
+    return m.is_empty_or(await fm, fn, *args, **kwargs)
 
 
 async def is_empty_or_async[T, **P](
@@ -222,11 +233,11 @@ async def is_empty_or_async[T, **P](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> bool:
-    return await m.is_empty_or_async((await fm._internal), fn, *args, **kwargs)
+    return await m.is_empty_or_async(await fm, fn, *args, **kwargs)
 
 
 async def is_some[T](fm: FutureMaybe[T]) -> bool:
-    return m.is_some(await fm._internal)
+    return m.is_some(await fm)
 
 
 async def is_some_and[T, **P](
@@ -235,7 +246,7 @@ async def is_some_and[T, **P](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> bool:
-    return m.is_some_and(await fm._internal, fn, *args, **kwargs)
+    return m.is_some_and(await fm, fn, *args, **kwargs)
 
 
 async def is_some_and_async[T, **P](
@@ -244,23 +255,23 @@ async def is_some_and_async[T, **P](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> bool:
-    return await m.is_some_and_async(await fm._internal, fn, *args, **kwargs)
+    return await m.is_some_and_async(await fm, fn, *args, **kwargs)
 
 
 async def expect[T](fm: FutureMaybe[T], what: str) -> T:
-    return m.expect(await fm._internal, what)
+    return m.expect(await fm, what)
 
 
 async def unwrap[T](fm: FutureMaybe[T]) -> T:
-    return m.unwrap(await fm._internal)
+    return m.unwrap(await fm)
 
 
 async def unwrap_or[T](fm: FutureMaybe[T], default: T) -> T:
-    return m.unwrap_or(await fm._internal, default)
+    return m.unwrap_or(await fm, default)
 
 
 async def unwrap_or_none[T](fm: FutureMaybe[T]) -> T | None:
-    return m.unwrap_or_none(await fm._internal)
+    return m.unwrap_or_none(await fm)
 
 
 async def map[T, **P, R](
@@ -269,7 +280,7 @@ async def map[T, **P, R](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> m.Maybe[R]:
-    return m.map(await fm._internal, fn, *args, **kwargs)
+    return await fm.map(fn, *args, **kwargs)
 
 
 async def map_async[T, **P, R](
@@ -278,7 +289,7 @@ async def map_async[T, **P, R](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> m.Maybe[R]:
-    return await m.map_async(await fm._internal, fn, *args, **kwargs)
+    return await fm.map_async(fn, *args, **kwargs)
 
 
 async def map_or[T, **P, R](
@@ -288,7 +299,7 @@ async def map_or[T, **P, R](
     *args: P.args,
     **kwargs: P.kwargs,
 ):
-    return m.map_or(await fm._internal, default, fn, *args, **kwargs)
+    return m.map_or(await fm, default, fn, *args, **kwargs)
 
 
 async def map_or_async[T, **P, R](
@@ -298,7 +309,7 @@ async def map_or_async[T, **P, R](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> R:
-    return await m.map_or_async(await fm._internal, default, fn, *args, **kwargs)
+    return await m.map_or_async(await fm, default, fn, *args, **kwargs)
 
 
 async def inspect[T, **P](
@@ -307,7 +318,7 @@ async def inspect[T, **P](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> m.Maybe[T]:
-    return m.inspect(await fm._internal, fn, *args, **kwargs)
+    return await fm.inspect(fn, *args, **kwargs)
 
 
 async def inspect_async[T, **P](
@@ -316,7 +327,26 @@ async def inspect_async[T, **P](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> m.Maybe[T]:
-    return await m.inspect_async(await fm._internal, fn, *args, **kwargs)
+    return await fm.inspect_async(fn, *args, **kwargs)
+
+
+async def _run(awaitable: Awaitable[m.Maybe[Any]], steps: list[_Step]) -> m.Maybe[Any]:
+    maybe = await awaitable
+
+    for fn, args, kwargs, is_async, keeps_value in steps:
+        # once maybe is `Empty` the rest of steps are skipped
+        if maybe is m._Empty:
+            break
+
+        value = fn(maybe._internal, *args, **kwargs)
+
+        if is_async:
+            value = await value
+
+        if not keeps_value:
+            maybe = m.Some(value)
+
+    return maybe
 
 
 def wraps[**P, T](fn: Callable[P, Awaitable[T]]) -> Callable[P, FutureMaybe[T]]:
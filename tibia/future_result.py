@@ -1,23 +1,47 @@
 from __future__ import annotations
 
+import asyncio
 import functools
 import warnings
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Concatenate
 
+from tibia import deadline
 from tibia import result as r
 from tibia.future import Future
+from tibia.utils import unroll
+
+
+# (fn, args, kwargs, is_async, on_err, keeps_value)
+type _Step = tuple[
+    Callable[..., Any], tuple[Any, ...], dict[str, Any], bool, bool, bool
+]
 
 
 @dataclass(slots=True)
 class FutureResult[T, E]:
-    _internal: Awaitable[r.Result[T, E]]
+    _internal: Awaitable[r.Result[Any, Any]]
+    # steps are recorded as `(last, (previous, ...))` and run in one coroutine
+    _steps: tuple[_Step, Any] | None = None
 
     def __await__(self):
-        return self._internal.__await__()
+        remaining = deadline.remaining()
+
+        if remaining is not None:
+            return _run_until(
+                self._internal, unroll(self._steps), remaining
+            ).__await__()
+
+        if self._steps is None:
+            return self._internal.__await__()
+
+        return _run(self._internal, unroll(self._steps)).__await__()
+
+    def _then(self, step: _Step) -> FutureResult[Any, Any]:
+        return FutureResult(self._internal, (step, self._steps))
 
     def is_ok(self) -> Future[bool]:
-        return Future(is_ok(self))
+        return _future(is_ok(self))
 
     def is_ok_and[**P](
         self,
@@ -25,7 +49,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[bool]:
-        return Future(is_ok_and(self, fn, *args, **kwargs))
+        return _future(is_ok_and(self, fn, *args, **kwargs))
 
     def is_ok_and_async[**P](
         self,
@@ -33,7 +57,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[bool]:
-        return Future(is_ok_and_async(self, fn, *args, **kwargs))
+        return _future(is_ok_and_async(self, fn, *args, **kwargs))
 
     def is_ok_or[**P](
         self,
@@ -41,7 +65,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[bool]:
-        return Future(is_ok_or(self, fn, *args, **kwargs))
+        return _future(is_ok_or(self, fn, *args, **kwargs))
 
     def is_ok_or_async[**P](
         self,
@@ -49,16 +73,16 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[bool]:
-        return Future(is_ok_or_async(self, fn, *args, **kwargs))
+        return _future(is_ok_or_async(self, fn, *args, **kwargs))
 
     def expect[T, E](self, what: str) -> Future[T]:
-        return Future(expect(self, what))
+        return _future(expect(self, what))
 
     def unwrap[T, E](self) -> Future[T]:
-        return Future(unwrap(self))
+        return _future(unwrap(self))
 
     def unwrap_or(self, default: T) -> Future[T]:
-        return Future(unwrap_or(self, default))
+        return _future(unwrap_or(self, default))
 
     def map[**P, R](
         self,
@@ -66,7 +90,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureResult[R, E]:
-        return FutureResult(map(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, False, False, False))
 
     def map_async[**P, R](
         self,
@@ -74,7 +98,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureResult[R, E]:
-        return FutureResult(map_async(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, True, False, False))
 
     def map_or[**P, R](
         self,
@@ -83,7 +107,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[R]:
-        return Future(map_or(self, default, fn, *args, **kwargs))
+        return _future(map_or(self, default, fn, *args, **kwargs))
 
     def map_or_async[**P, R](
         self,
@@ -92,7 +116,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[R]:
-        return Future(map_or_async(self, default, fn, *args, **kwargs))
+        return _future(map_or_async(self, default, fn, *args, **kwargs))
 
     def inspect[**P](
         self,
@@ -100,7 +124,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureResult[T, E]:
-        return FutureResult(inspect(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, False, False, True))
 
     def inspect_async[**P](
         self,
@@ -108,10 +132,10 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureResult[T, E]:
-        return FutureResult(inspect_async(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, True, False, True))
 
     def is_err(self) -> Future[bool]:
-        return Future(is_err(self))
+        return _future(is_err(self))
 
     def is_err_and[**P](
         self,
@@ -119,7 +143,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[bool]:
-        return Future(is_err_and(self, fn, *args, **kwargs))
+        return _future(is_err_and(self, fn, *args, **kwargs))
 
     def is_err_and_async[**P](
         self,
@@ -127,7 +151,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[bool]:
-        return Future(is_err_and_async(self, fn, *args, **kwargs))
+        return _future(is_err_and_async(self, fn, *args, **kwargs))
 
     def is_err_or[**P](
         self,
@@ -135,7 +159,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[bool]:
-        return Future(is_err_or(self, fn, *args, **kwargs))
+        return _future(is_err_or(self, fn, *args, **kwargs))
 
     def is_err_or_async[**P](
         self,
@@ -143,16 +167,16 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[bool]:
-        return Future(is_err_or_async(self, fn, *args, **kwargs))
+        return _future(is_err_or_async(self, fn, *args, **kwargs))
 
     def expect_err(self, what: str) -> Future[E]:
-        return Future(expect_err(self, what))
+        return _future(expect_err(self, what))
 
     def unwrap_err(self) -> Future[E]:
-        return Future(unwrap_err(self))
+        return _future(unwrap_err(self))
 
     def unwrap_err_or(self, default: E) -> Future[E]:
-        return Future(unwrap_err_or(self, default))
+        return _future(unwrap_err_or(self, default))
 
     def map_err[**P, R](
         self,
@@ -160,7 +184,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureResult[T, E]:
-        return FutureResult(map_err(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, False, True, False))
 
     def map_err_async[**P, R](
         self,
@@ -168,7 +192,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureResult[T, E]:
-        return FutureResult(map_err_async(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, True, True, False))
 
     def map_err_or[**P, R](
         self,
@@ -177,7 +201,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[R]:
-        return Future(map_err_or(self, default, fn, *args, **kwargs))
+        return _future(map_err_or(self, default, fn, *args, **kwargs))
 
     def map_err_or_async[**P, R](
         self,
@@ -186,7 +210,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Future[R]:
-        return Future(map_err_or_async(self, default, fn, *args, **kwargs))
+        return _future(map_err_or_async(self, default, fn, *args, **kwargs))
 
     def inspect_err[**P](
         self,
@@ -194,7 +218,7 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureResult[T, E]:
-        return FutureResult(inspect_err(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, False, True, True))
 
     def inspect_err_async[**P](
         self,
@@ -202,17 +226,16 @@ class FutureResult[T, E]:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> FutureResult[T, E]:
-        return FutureResult(inspect_err_async(self, fn, *args, **kwargs))
+        return self._then((fn, args, kwargs, True, True, True))
 
     @staticmethod
     def wraps[**P, R](fn: Callable[P, Awaitable[R]]):
-        warnings.simplefilter("always", DeprecationWarning)
         warnings.warn(
             "FutureResult.wraps will be deprecated in tibia@3.0.0, "
             "use future_result.wraps instead",
             DeprecationWarning,
+            stacklevel=2,
         )
-        warnings.simplefilter("default", DeprecationWarning)
 
         @functools.wraps(fn)
         def _wraps(*args: P.args, **kwargs: P.kwargs) -> FutureResult[R, Exception]:
@@ -222,13 +245,12 @@ class FutureResult[T, E]:
 
     @staticmethod
     def safe(*exceptions: Exception):
-        warnings.simplefilter("always", DeprecationWarning)
         warnings.warn(
             "FutureResult.safe will be deprecated in tibia@3.0.0, "
             "use future_result.safe or future_result.safe_from instead",
             DeprecationWarning,
+            stacklevel=2,
         )
-        warnings.simplefilter("default", DeprecationWarning)
 
         def _safe[**P, R](
             fn: Callable[P, Awaitable[R]],
@@ -300,7 +322,7 @@ async def map[T, E, **P, R](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> r.Result[R, E]:
-    return r.map(await fr, fn, *args, **kwargs)
+    return await fr.map(fn, *args, **kwargs)
 
 
 async def map_async[T, E, **P, R](
@@ -309,7 +331,7 @@ async def map_async[T, E, **P, R](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> r.Result[R, E]:
-    return await r.map_async(await fr, fn, *args, **kwargs)
+    return await fr.map_async(fn, *args, **kwargs)
 
 
 async def map_or[T, E, **P, R](
@@ -338,7 +360,7 @@ async def inspect[T, E, **P](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> r.Result[T, E]:
-    return r.inspect(await fr, fn, *args, **kwargs)
+    return await fr.inspect(fn, *args, **kwargs)
 
 
 async def inspect_async[T, E, **P](
@@ -347,7 +369,7 @@ async def inspect_async[T, E, **P](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> r.Result[T, E]:
-    return await r.inspect_async(await fr, fn, *args, **kwargs)
+    return await fr.inspect_async(fn, *args, **kwargs)
 
 
 async def is_err[T, E](fr: FutureResult[T, E]) -> bool:
@@ -408,7 +430,7 @@ async def map_err[T, E, **P, R](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> r.Result[T, R]:
-    return r.map_err(await fr, fn, *args, **kwargs)
+    return await fr.map_err(fn, *args, **kwargs)
 
 
 async def map_err_async[T, E, **P, R](
@@ -417,7 +439,7 @@ async def map_err_async[T, E, **P, R](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> r.Result[T, R]:
-    return await r.map_err_async(await fr, fn, *args, **kwargs)
+    return await fr.map_err_async(fn, *args, **kwargs)
 
 
 async def map_err_or[T, E, **P, R](
@@ -446,7 +468,7 @@ async def inspect_err[T, E, **P](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> r.Result[T, E]:
-    return r.inspect_err(await fr, fn, *args, **kwargs)
+    return await fr.inspect_err(fn, *args, **kwargs)
 
 
 async def inspect_err_async[T, E, **P](
@@ -455,7 +477,56 @@ async def inspect_err_async[T, E, **P](
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> r.Result[T, E]:
-    return await r.inspect_err_async(await fr, fn, *args, **kwargs)
+    return await fr.inspect_err_async(fn, *args, **kwargs)
+
+
+async def _run(
+    awaitable: Awaitable[r.Result[Any, Any]],
+    steps: list[_Step],
+) -> r.Result[Any, Any]:
+    result = await awaitable
+    # once result is `Err` and no `Err` steps are left, the rest are skipped
+    last_on_err = max((i for i, step in enumerate(steps) if step[4]), default=-1)
+
+    for i, (fn, args, kwargs, is_async, on_err, keeps_value) in enumerate(steps):
+        if isinstance(result, r.Err) is not on_err:
+            if i > last_on_err:
+                break
+
+            continue
+
+        value = fn(result._internal, *args, **kwargs)
+
+        if is_async:
+            value = await value
+
+        if not keeps_value:
+            result = r.Err(value) if on_err else r.Ok(value)
+
+    return result
+
+
+def _future[T](awaitable: Awaitable[T]) -> Future[T]:
+    # awaitable resolves through the `FutureResult`, which already turns the
+    # deadline into `Err(TimeoutError)`
+    return Future(awaitable, None, True)
+
+
+async def _run_until(
+    awaitable: Awaitable[r.Result[Any, Any]],
+    steps: list[_Step],
+    remaining: float,
+) -> r.Result[Any, Any]:
+    timeout = asyncio.timeout(remaining)
+
+    try:
+        async with timeout:
+            return await _run(awaitable, steps)
+    except TimeoutError as exc:
+        if not timeout.expired():
+            raise
+
+        return r.Err(exc)
 
 
 def _async_wraps[**P, R](
@@ -468,19 +539,26 @@ def _async_wraps[**P, R](
     return _wraps
 
 
-def _async_safe(*exceptions: Exception):
+def _async_safe(
+    *exceptions: Exception,
+    record: bool = False,
+    with_traceback: bool = False,
+):
     if not exceptions:
         exceptions = (Exception,)
 
     def _safe[**P, R](
         fn: Callable[P, Awaitable[R]],
-    ) -> Callable[P, Awaitable[r.Result[R, Exception]]]:
+    ) -> Callable[P, Awaitable[r.Result[R, Exception | r.ErrorRecord]]]:
         @functools.wraps(fn)
-        async def __safe(*args: P.args, **kwargs: P.kwargs) -> r.Result[R, Exception]:
+        async def __safe(
+            *args: P.args,
+            **kwargs: P.kwargs,
+        ) -> r.Result[R, Exception | r.ErrorRecord]:
             try:
                 return r.Ok(await fn(*args, **kwargs))
             except exceptions as exc:
-                return r.Err(exc)
+                return r.Err(r._capture(exc, record, with_traceback))
 
         return __safe
 
@@ -500,26 +578,100 @@ def wraps[**P, T](
 def safe[**P, T](
     fn: Callable[P, Awaitable[T]],
 ) -> Callable[P, FutureResult[T, Exception]]:
+    _safe = _async_safe()(fn)
+
     @functools.wraps(fn)
     def _wraps(*args: P.args, **kwargs: P.kwargs) -> FutureResult[T, Exception]:
-        return FutureResult(_async_safe()(fn)(*args, **kwargs))
+        return FutureResult(_safe(*args, **kwargs))
 
     return _wraps
 
 
-def safe_from(*exceptions: Exception):
-    if not exceptions:
-        exceptions = (Exception,)
-
+def safe_from(
+    *exceptions: Exception,
+    record: bool = False,
+    with_traceback: bool = False,
+):
     def _safe_from[**P, T](
         fn: Callable[P, Awaitable[T]],
-    ) -> Callable[P, FutureResult[T, Exception]]:
+    ) -> Callable[P, FutureResult[T, Exception | r.ErrorRecord]]:
+        _safe = _async_safe(
+            *exceptions,
+            record=record,
+            with_traceback=with_traceback,
+        )(fn)
+
         @functools.wraps(fn)
         def __safe_from(
             *args: P.args, **kwargs: P.kwargs
-        ) -> FutureResult[T, Exception]:
-            return FutureResult(_async_safe(*exceptions)(fn)(*args, **kwargs))
+        ) -> FutureResult[T, Exception | r.ErrorRecord]:
+            return FutureResult(_safe(*args, **kwargs))
 
         return __safe_from
 
     return _safe_from
+
+
+def hedge(delay: float, max_ratio: float = 0.1):
+    if delay < 0:
+        raise ValueError("delay must not be negative")
+
+    if not 0 <= max_ratio <= 1:
+        raise ValueError("max_ratio must be between 0 and 1")
+
+    def _hedge[**P, T, E](
+        fn: Callable[P, FutureResult[T, E]],
+    ) -> Callable[P, FutureResult[T, E]]:
+        # each call earns `max_ratio` of a hedge, so at most that share of calls
+        # is duplicated (counts are integers, so the share is not lost to
+        # rounding)
+        calls = 0
+        hedges = 0
+
+        async def _attempt(*args: P.args, **kwargs: P.kwargs) -> r.Result[T, E]:
+            return await fn(*args, **kwargs)
+
+        async def _hedged(*args: P.args, **kwargs: P.kwargs) -> r.Result[T, E]:
+            nonlocal calls, hedges
+
+            # calls earn nothing while a whole hedge is saved up
+            if hedges + 1 > max_ratio * calls:
+                calls += 1
+
+            attempts = {asyncio.ensure_future(_attempt(*args, **kwargs))}
+            error: r.Result[T, E] | None = None
+
+            try:
+                done, _ = await asyncio.wait(attempts, timeout=delay)
+
+                if not done and hedges + 1 <= max_ratio * calls:
+                    hedges += 1
+                    attempts.add(asyncio.ensure_future(_attempt(*args, **kwargs)))
+
+                while True:
+                    done, attempts = await asyncio.wait(
+                        attempts, return_when=asyncio.FIRST_COMPLETED
+                    )
+
+                    for task in done:
+                        result = task.result()
+
+                        if result.is_ok():
+                            return result
+
+                        if error is None:
+                            error = result
+
+                    if not attempts:
+                        return error
+            finally:
+                for task in attempts:
+                    task.cancel()
+
+        @functools.wraps(fn)
+        def __hedge(*args: P.args, **kwargs: P.kwargs) -> FutureResult[T, E]:
+            return FutureResult(_hedged(*args, **kwargs))
+
+        return __hedge
+
+    return _hedge
@@ -1,8 +1,12 @@
-from . import aio, lazy, threaded
+from . import aio, external, interpreter, lazy, process, stream, threaded
 from .eager import (
+    bottom_k,
     filter,
     first,
     group_by,
+    group_by_aggregate,
+    group_by_reduce,
+    group_by_reduce_to,
     inspect,
     join,
     map,
@@ -12,15 +16,24 @@ from .eager import (
     sort_asc,
     sort_desc,
     take,
+    top_k,
 )
 
 __all__ = [
     "aio",
+    "external",
+    "interpreter",
     "lazy",
+    "process",
+    "stream",
     "threaded",
+    "bottom_k",
     "filter",
     "first",
     "group_by",
+    "group_by_aggregate",
+    "group_by_reduce",
+    "group_by_reduce_to",
     "inspect",
     "join",
     "map",
@@ -30,4 +43,5 @@ __all__ = [
     "sort_asc",
     "sort_desc",
     "take",
+    "top_k",
 ]
@@ -1,22 +1,115 @@
 import asyncio
-from typing import Any, Awaitable, Callable, Concatenate, Iterable
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Concatenate,
+    Iterable,
+    Mapping,
+)
+
+from tibia.rate_limiter import RateLimiter
+from tibia.utils import iterate_async
 
 
 async def map[T, **P, R](
     iterable: Iterable[T],
     func: Callable[Concatenate[T, P], Awaitable[R]],
     *args: P.args,
+    max_concurrency: int | None = None,
+    rate_limiter: RateLimiter | None = None,
     **kwargs: P.kwargs,
 ) -> list[R]:
-    return await asyncio.gather(*[func(item, *args, **kwargs) for item in iterable])
+    if rate_limiter is not None:
+        func = rate_limiter.limit(func)
+
+    if max_concurrency is None:
+        return await asyncio.gather(*[func(item, *args, **kwargs) for item in iterable])
+
+    return [
+        result
+        async for result in imap(
+            iterable, func, *args, max_concurrency=max_concurrency, **kwargs
+        )
+    ]
+
+
+async def imap[T, **P, R](
+    iterable: Iterable[T] | AsyncIterable[T],
+    func: Callable[Concatenate[T, P], Awaitable[R]],
+    *args: P.args,
+    max_concurrency: int = 64,
+    ordered: bool = True,
+    rate_limiter: RateLimiter | None = None,
+    **kwargs: P.kwargs,
+) -> AsyncIterator[R]:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be positive")
+
+    if rate_limiter is not None:
+        func = rate_limiter.limit(func)
+
+    items = iterate_async(iterable)
+    # ordered results are awaited from the head of the window, unordered ones
+    # are taken as soon as any task of the window completes
+    window: deque[asyncio.Future[R]] = deque()
+    pending: set[asyncio.Future[R]] = set()
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(window) + len(pending) < max_concurrency:
+                try:
+                    item = await anext(items)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+
+                task = asyncio.ensure_future(func(item, *args, **kwargs))
+
+                if ordered:
+                    window.append(task)
+                else:
+                    pending.add(task)
+
+            if ordered:
+                if not window:
+                    return
+
+                yield await window.popleft()
+            else:
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    yield task.result()
+    finally:
+        unfinished = [*window, *pending]
+
+        for task in unfinished:
+            task.cancel()
+
+        await asyncio.gather(*unfinished, return_exceptions=True)
+        await items.aclose()
 
 
 async def inspect[T, **P](
     iterable: Iterable[T],
     func: Callable[Concatenate[T, P], Awaitable[Any]],
     *args: P.args,
+    rate_limiter: RateLimiter | None = None,
     **kwargs: P.kwargs,
 ) -> list[T]:
+    if rate_limiter is not None:
+        func = rate_limiter.limit(func)
+
     _iterable = list(iterable)
     await asyncio.gather(*[func(item, *args, **kwargs) for item in _iterable])
     return _iterable
@@ -26,18 +119,86 @@ async def filter[T, **P](
     iterable: Iterable[T],
     func: Callable[Concatenate[T, P], Awaitable[bool]],
     *args: P.args,
+    max_concurrency: int | None = None,
+    rate_limiter: RateLimiter | None = None,
     **kwargs: P.kwargs,
 ) -> list[T]:
-    async def _func(item: T, *args: P.args, **kwargs: P.kwargs) -> tuple[bool, T]:
-        return (await func(item, *args, **kwargs), item)
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be positive")
 
-    tasks = [asyncio.create_task(_func(item, *args, **kwargs)) for item in iterable]
-    result = []
+    if rate_limiter is not None:
+        func = rate_limiter.limit(func)
 
-    for task in asyncio.as_completed(tasks):
-        predicate, item = await task
+    items = list(iterable)
+    semaphore = asyncio.Semaphore(max_concurrency or len(items) or 1)
+
+    async def _func(item: T) -> bool:
+        async with semaphore:
+            return await func(item, *args, **kwargs)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(_func(item)) for item in items]
+    except ExceptionGroup as error:
+        raise error.exceptions[0] from None
+
+    return [item for item, task in zip(items, tasks) if task.result()]
+
+
+async def _keyed[T, **P, K](
+    iterable: Iterable[T] | AsyncIterable[T],
+    fn: Callable[Concatenate[T, P], Awaitable[K]],
+    max_concurrency: int,
+    rate_limiter: RateLimiter | None,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> AsyncIterator[tuple[K, T]]:
+    if rate_limiter is not None:
+        fn = rate_limiter.limit(fn)
+
+    async def _key(item: T) -> tuple[K, T]:
+        return await fn(item, *args, **kwargs), item
+
+    async for key, item in imap(iterable, _key, max_concurrency=max_concurrency):
+        yield key, item
+
+
+async def group_by[T, **P, K](
+    iterable: Iterable[T] | AsyncIterable[T],
+    fn: Callable[Concatenate[T, P], Awaitable[K]],
+    *args: P.args,
+    max_concurrency: int = 64,
+    rate_limiter: RateLimiter | None = None,
+    **kwargs: P.kwargs,
+) -> Mapping[K, list[T]]:
+    mapping = dict[K, list[T]]()
+
+    async for key, item in _keyed(
+        iterable, fn, max_concurrency, rate_limiter, *args, **kwargs
+    ):
+        if key not in mapping:
+            mapping[key] = []
+
+        mapping[key].append(item)
+
+    return mapping
+
+
+async def group_by_reduce_to[T, **P, K, R](
+    iterable: Iterable[T] | AsyncIterable[T],
+    fn: Callable[Concatenate[T, P], Awaitable[K]],
+    reducer: Callable[[R, T], R],
+    initial: Callable[[], R],
+    *args: P.args,
+    max_concurrency: int = 64,
+    rate_limiter: RateLimiter | None = None,
+    **kwargs: P.kwargs,
+) -> Mapping[K, R]:
+    mapping = dict[K, R]()
 
-        if predicate:
-            result.append(item)
+    async for key, item in _keyed(
+        iterable, fn, max_concurrency, rate_limiter, *args, **kwargs
+    ):
+        mapping[key] = reducer(mapping[key] if key in mapping else initial(), item)
 
-    return result
+    return mapping
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import heapq
+from collections import Counter, deque
 from functools import reduce as _py_reduce
-from typing import Any, Callable, Concatenate, Iterable, Mapping
+from itertools import islice
+from typing import Any, Callable, Concatenate, Iterable, Literal, Mapping
 
 from tibia.utils import identity
 
@@ -89,18 +92,41 @@ def sort_desc[T, **P](
     return sorted(iterable, key=lambda v: key(v, *args, **kwargs), reverse=True)
 
 
+def top_k[T, **P](
+    iterable: Iterable[T],
+    count: int,
+    key: Callable[Concatenate[T, P], Any] | None = None,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> list[T]:
+    if not key:
+        return heapq.nlargest(count, iterable)
+
+    return heapq.nlargest(count, iterable, key=lambda v: key(v, *args, **kwargs))
+
+
+def bottom_k[T, **P](
+    iterable: Iterable[T],
+    count: int,
+    key: Callable[Concatenate[T, P], Any] | None = None,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> list[T]:
+    if not key:
+        return heapq.nsmallest(count, iterable)
+
+    return heapq.nsmallest(count, iterable, key=lambda v: key(v, *args, **kwargs))
+
+
 def take[T](
     iterable: Iterable[T],
     count: int,
 ) -> list[T]:
-    if count == 0:
-        return []
-    elif count > 0:
-        return [item for i, item in enumerate(iterable) if i < count]
-    else:
-        _iterable = list(iterable)
-        _iterable_len = len(_iterable)
-        return [item for i, item in enumerate(_iterable) if i >= _iterable_len + count]
+    if count >= 0:
+        return list(islice(iterable, count))
+
+    # only last `-count` items are kept while iterating
+    return list(deque(iterable, maxlen=-count))
 
 
 def first[T](
@@ -117,14 +143,19 @@ def skip[T](
     iterable: Iterable[T],
     count: int,
 ) -> Iterable[T]:
-    if count == 0:
-        return list(iterable)
-    elif count > 0:
-        return [item for i, item in enumerate(iterable) if i >= count]
-    else:
-        _iterable = list(iterable)
-        _iterable_len = len(_iterable)
-        return [item for i, item in enumerate(_iterable) if i < _iterable_len + count]
+    if count >= 0:
+        return list(islice(iterable, count, None))
+
+    # item is released only when `-count` newer items follow it
+    items = iter(iterable)
+    buffer = deque(islice(items, -count))
+    result = []
+
+    for item in items:
+        result.append(buffer.popleft())
+        buffer.append(item)
+
+    return result
 
 
 def join[T](iterables: Iterable[Iterable[T]]) -> list[T]:
@@ -148,3 +179,81 @@ def group_by[T, **P, K](
         mapping[key].append(item)
 
     return mapping
+
+
+def group_by_reduce[T, **P, K](
+    iterable: Iterable[T],
+    fn: Callable[Concatenate[T, P], K],
+    reducer: Callable[[T, T], T],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> Mapping[K, T]:
+    mapping = dict[K, T]()
+
+    for item in iterable:
+        key = fn(item, *args, **kwargs)
+        mapping[key] = reducer(mapping[key], item) if key in mapping else item
+
+    return mapping
+
+
+def group_by_reduce_to[T, **P, K, R](
+    iterable: Iterable[T],
+    fn: Callable[Concatenate[T, P], K],
+    reducer: Callable[[R, T], R],
+    initial: Callable[[], R],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> Mapping[K, R]:
+    mapping = dict[K, R]()
+
+    # every group gets its own accumulator, so reducer may mutate it
+    for item in iterable:
+        key = fn(item, *args, **kwargs)
+        mapping[key] = reducer(mapping[key] if key in mapping else initial(), item)
+
+    return mapping
+
+
+type Aggregator = Literal["count", "sum", "min", "max", "first", "last"]
+
+
+def group_by_aggregate[T, **P, K](
+    iterable: Iterable[T],
+    fn: Callable[Concatenate[T, P], K],
+    aggregator: Aggregator,
+    *args: P.args,
+    value: Callable[[T], Any] | None = None,
+    **kwargs: P.kwargs,
+) -> Mapping[K, Any]:
+    mapping = dict[K, Any]()
+
+    if value is None:
+        pairs = ((fn(item, *args, **kwargs), item) for item in iterable)
+    else:
+        pairs = ((fn(item, *args, **kwargs), value(item)) for item in iterable)
+
+    match aggregator:
+        case "count":
+            return dict(Counter(fn(item, *args, **kwargs) for item in iterable))
+        case "sum":
+            # sum starts from 0 (as builtin `sum`), so items are never mutated
+            for key, _value in pairs:
+                mapping[key] = mapping.get(key, 0) + _value
+        case "min":
+            for key, _value in pairs:
+                if key not in mapping or _value < mapping[key]:
+                    mapping[key] = _value
+        case "max":
+            for key, _value in pairs:
+                if key not in mapping or _value > mapping[key]:
+                    mapping[key] = _value
+        case "first":
+            for key, _value in pairs:
+                mapping.setdefault(key, _value)
+        case "last":
+            return dict(pairs)
+        case _:
+            raise ValueError(f"unknown aggregator: {aggregator}")
+
+    return mapping
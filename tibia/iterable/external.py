@@ -0,0 +1,238 @@
+import heapq
+import pickle
+import tempfile
+from itertools import islice
+from typing import IO, Any, Callable, Concatenate, Iterable, Iterator
+
+# items of a run are pickled in batches, so the file is compact and reading it
+# back keeps only one batch per run in memory
+_BATCH_SIZE = 1024
+# once this many files of the same level are spilled they are merged into a
+# single file of the next level, so the number of open files stays bounded and
+# every item is rewritten only once per level
+_FAN_IN = 64
+
+
+def _spill[T](items: Iterable[T], file: IO[bytes]) -> IO[bytes]:
+    items = iter(items)
+
+    while batch := list(islice(items, _BATCH_SIZE)):
+        pickle.dump(batch, file, pickle.HIGHEST_PROTOCOL)
+
+    file.seek(0)
+    return file
+
+
+def _load[T](file: IO[bytes]) -> Iterator[T]:
+    while True:
+        try:
+            batch = pickle.load(file)
+        except EOFError:
+            return
+
+        yield from batch
+
+
+def _merge[T](
+    files: list[IO[bytes]],
+    run: list[T],
+    key: Callable[[T], Any] | None,
+    reverse: bool,
+) -> Iterator[T]:
+    # runs are passed in input order, so equal items keep it (as in `sorted`)
+    return heapq.merge(*[_load(file) for file in files], run, key=key, reverse=reverse)
+
+
+def _sort[T](
+    iterable: Iterable[T],
+    key: Callable[[T], Any] | None,
+    reverse: bool,
+    run_size: int,
+) -> Iterator[T]:
+    items = iter(iterable)
+    # files of higher levels hold earlier items
+    levels: list[list[IO[bytes]]] = [[]]
+
+    try:
+        run = list(islice(items, run_size))
+
+        while run:
+            run.sort(key=key, reverse=reverse)
+            following = list(islice(items, 1))
+
+            # the last run is merged from memory, previous ones are spilled
+            # before the next one is read, so only one run is kept in memory
+            if not following:
+                break
+
+            levels[0].append(_spill(run, tempfile.TemporaryFile()))
+
+            level = 0
+
+            while len(levels[level]) == _FAN_IN:
+                files, levels[level] = levels[level], []
+
+                if level + 1 == len(levels):
+                    levels.append([])
+
+                levels[level + 1].append(tempfile.TemporaryFile())
+
+                try:
+                    _spill(_merge(files, [], key, reverse), levels[level + 1][-1])
+                finally:
+                    for file in files:
+                        file.close()
+
+                level += 1
+
+            run = following
+            run.extend(islice(items, run_size - 1))
+
+        files = [file for spilled in reversed(levels) for file in spilled]
+        yield from _merge(files, run, key, reverse)
+    finally:
+        for spilled in levels:
+            for file in spilled:
+                file.close()
+
+
+def _check_run_size(run_size: int) -> None:
+    if run_size < 1:
+        raise ValueError("run_size must be positive")
+
+
+def sort_asc[T, **P](
+    iterable: Iterable[T],
+    key: Callable[Concatenate[T, P], Any] | None = None,
+    *args: P.args,
+    run_size: int = 100_000,
+    **kwargs: P.kwargs,
+) -> Iterator[T]:
+    _check_run_size(run_size)
+
+    if not key:
+        return _sort(iterable, None, False, run_size)
+
+    return _sort(iterable, lambda v: key(v, *args, **kwargs), False, run_size)
+
+
+def sort_desc[T, **P](
+    iterable: Iterable[T],
+    key: Callable[Concatenate[T, P], Any] | None = None,
+    *args: P.args,
+    run_size: int = 100_000,
+    **kwargs: P.kwargs,
+) -> Iterator[T]:
+    _check_run_size(run_size)
+
+    if not key:
+        return _sort(iterable, None, True, run_size)
+
+    return _sort(iterable, lambda v: key(v, *args, **kwargs), True, run_size)
+
+
+def _group[T, K, R](
+    pairs: Iterable[tuple[K, T]],
+    reducer: Callable[[R, T], R],
+    initial: Callable[[], R],
+    max_keys: int,
+    partitions: int,
+    level: int,
+) -> Iterator[tuple[K, R]]:
+    mapping = dict[K, R]()
+    # pairs with keys that do not fit into memory are partitioned by key hash,
+    # so every key ends up in a single file that is grouped on its own
+    files: list[IO[bytes]] = []
+    buffers: list[list[tuple[K, T]]] = []
+
+    try:
+        for key, item in pairs:
+            if key in mapping:
+                mapping[key] = reducer(mapping[key], item)
+            elif len(mapping) < max_keys:
+                mapping[key] = reducer(initial(), item)
+            else:
+                if not files:
+                    files = [tempfile.TemporaryFile() for _ in range(partitions)]
+                    buffers = [[] for _ in range(partitions)]
+
+                # hash is salted with level, so overflowing file is split anew
+                index = hash((level, key)) % partitions
+                buffers[index].append((key, item))
+
+                if len(buffers[index]) == _BATCH_SIZE:
+                    pickle.dump(buffers[index], files[index], pickle.HIGHEST_PROTOCOL)
+                    buffers[index] = []
+
+        yield from mapping.items()
+        mapping.clear()
+
+        for file, buffer in zip(files, buffers):
+            if buffer:
+                pickle.dump(buffer, file, pickle.HIGHEST_PROTOCOL)
+
+            file.seek(0)
+
+        for file in files:
+            yield from _group(
+                _load(file), reducer, initial, max_keys, partitions, level + 1
+            )
+            file.close()
+    finally:
+        for file in files:
+            file.close()
+
+
+def _append[T](group: list[T], item: T) -> list[T]:
+    group.append(item)
+    return group
+
+
+def _check(max_keys: int, partitions: int) -> None:
+    if max_keys < 1:
+        raise ValueError("max_keys must be positive")
+
+    if partitions < 2:
+        raise ValueError("partitions must be at least 2")
+
+
+def group_by[T, **P, K](
+    iterable: Iterable[T],
+    fn: Callable[Concatenate[T, P], K],
+    *args: P.args,
+    max_keys: int = 1_000_000,
+    partitions: int = 64,
+    **kwargs: P.kwargs,
+) -> Iterator[tuple[K, list[T]]]:
+    _check(max_keys, partitions)
+
+    return _group(
+        ((fn(item, *args, **kwargs), item) for item in iterable),
+        _append,
+        list,
+        max_keys,
+        partitions,
+        0,
+    )
+
+
+def group_by_reduce_to[T, **P, K, R](
+    iterable: Iterable[T],
+    fn: Callable[Concatenate[T, P], K],
+    reducer: Callable[[R, T], R],
+    initial: Callable[[], R],
+    *args: P.args,
+    max_keys: int = 1_000_000,
+    partitions: int = 64,
+    **kwargs: P.kwargs,
+) -> Iterator[tuple[K, R]]:
+    _check(max_keys, partitions)
+
+    return _group(
+        ((fn(item, *args, **kwargs), item) for item in iterable),
+        reducer,
+        initial,
+        max_keys,
+        partitions,
+        0,
+    )
@@ -0,0 +1,96 @@
+import os
+from concurrent.futures import Executor
+from typing import Any, Callable, Concatenate, Iterable, Iterator
+
+from tibia.iterable import threaded
+
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+except ImportError:  # pragma: no cover - python < 3.14
+    InterpreterPoolExecutor = None
+
+
+def _interpreter_pool(max_workers: int | None) -> Executor:
+    if InterpreterPoolExecutor is None:
+        raise RuntimeError("InterpreterPoolExecutor requires python 3.14 or newer")
+
+    return InterpreterPoolExecutor(max_workers)  # pragma: no cover - python 3.14
+
+
+def _execute[T, R](
+    iterable: Iterable[T],
+    func: Callable[..., R],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    executor: Executor | None,
+    max_workers: int | None,
+    ordered: bool,
+    window: int | None,
+) -> Iterator[tuple[T, R]]:
+    # every interpreter runs Python code on its own core
+    return threaded._execute(
+        iterable,
+        func,
+        args,
+        kwargs,
+        executor,
+        max_workers or os.cpu_count() or 1,
+        ordered,
+        window,
+        _interpreter_pool,
+    )
+
+
+def map[T, **P, R](
+    iterable: Iterable[T],
+    func: Callable[Concatenate[T, P], R],
+    *args: P.args,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    ordered: bool = False,
+    window: int | None = None,
+    **kwargs: P.kwargs,
+) -> Iterable[R]:
+    return (
+        result
+        for _, result in _execute(
+            iterable, func, args, kwargs, executor, max_workers, ordered, window
+        )
+    )
+
+
+def inspect[T, **P](
+    iterable: Iterable[T],
+    func: Callable[Concatenate[T, P], Any],
+    *args: P.args,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    ordered: bool = False,
+    window: int | None = None,
+    **kwargs: P.kwargs,
+) -> Iterable[T]:
+    return (
+        item
+        for item, _ in _execute(
+            iterable, func, args, kwargs, executor, max_workers, ordered, window
+        )
+    )
+
+
+def filter[T, **P, R](
+    iterable: Iterable[T],
+    func: Callable[Concatenate[T, P], R],
+    *args: P.args,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    ordered: bool = False,
+    window: int | None = None,
+    **kwargs: P.kwargs,
+) -> Iterable[T]:
+    return (
+        item
+        for item, result in _execute(
+            iterable, func, args, kwargs, executor, max_workers, ordered, window
+        )
+        if result
+    )
@@ -1,5 +1,7 @@
 from typing import Any, Callable, Concatenate, Iterable
 
+from tibia.iterable import eager
+
 
 def map[T, **P, R](
     iterable: Iterable[T],
@@ -67,3 +69,23 @@ def take_while[T, **P](
 def join[T](iterable: Iterable[Iterable[T]]) -> Iterable[T]:
     for sub_iterable in iterable:
         yield from sub_iterable
+
+
+def top_k[T, **P](
+    iterable: Iterable[T],
+    count: int,
+    key: Callable[Concatenate[T, P], Any] | None = None,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> Iterable[T]:
+    yield from eager.top_k(iterable, count, key, *args, **kwargs)
+
+
+def bottom_k[T, **P](
+    iterable: Iterable[T],
+    count: int,
+    key: Callable[Concatenate[T, P], Any] | None = None,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> Iterable[T]:
+    yield from eager.bottom_k(iterable, count, key, *args, **kwargs)
@@ -0,0 +1,163 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Concatenate, Iterable, Iterator, Sized
+
+from tibia.iterable import threaded
+
+# chunks of iterable with unknown length grow from 1 up to this size, so the
+# first results arrive fast and later ones pay less for pickling round-trips
+_MAX_CHUNKSIZE = 1024
+
+
+def _workers(max_workers: int | None) -> int:
+    return max_workers or os.cpu_count() or 1
+
+
+def _chunks[T](
+    iterable: Iterable[T],
+    chunksize: int | None,
+    workers: int,
+) -> Iterator[list[T]]:
+    if chunksize is None and isinstance(iterable, Sized):
+        chunksize = max(1, -(-len(iterable) // (workers * 4)))
+
+    items = iter(iterable)
+    size = chunksize or 1
+
+    while chunk := list(islice(items, size)):
+        yield chunk
+
+        if chunksize is None:
+            size = min(size * 2, _MAX_CHUNKSIZE)
+
+
+def _apply_chunk[T, R](
+    chunk: list[T],
+    func: Callable[..., R],
+    *args: Any,
+    **kwargs: Any,
+) -> list[R]:
+    return [func(item, *args, **kwargs) for item in chunk]
+
+
+def _execute[T, R](
+    iterable: Iterable[T],
+    func: Callable[..., R],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    executor: Executor | None,
+    max_workers: int | None,
+    ordered: bool,
+    window: int | None,
+    chunksize: int | None,
+) -> Iterator[tuple[T, R]]:
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("chunksize must be positive")
+
+    workers = _workers(max_workers)
+    chunks = threaded._execute(
+        _chunks(iterable, chunksize, workers),
+        _apply_chunk,
+        (func, *args),
+        kwargs,
+        executor,
+        workers,
+        ordered,
+        window,
+        ProcessPoolExecutor,
+    )
+
+    return (pair for chunk, results in chunks for pair in zip(chunk, results))
+
+
+def warm_pool(max_workers: int | None = None, **kwargs: Any) -> ProcessPoolExecutor:
+    executor = ProcessPoolExecutor(_workers(max_workers), **kwargs)
+
+    # workers are started on demand, so occupy all of them once upfront
+    for future in [executor.submit(os.getpid) for _ in range(_workers(max_workers))]:
+        future.result()
+
+    return executor
+
+
+def map[T, **P, R](
+    iterable: Iterable[T],
+    func: Callable[Concatenate[T, P], R],
+    *args: P.args,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    ordered: bool = False,
+    window: int | None = None,
+    chunksize: int | None = None,
+    **kwargs: P.kwargs,
+) -> Iterable[R]:
+    return (
+        result
+        for _, result in _execute(
+            iterable,
+            func,
+            args,
+            kwargs,
+            executor,
+            max_workers,
+            ordered,
+            window,
+            chunksize,
+        )
+    )
+
+
+def inspect[T, **P](
+    iterable: Iterable[T],
+    func: Callable[Concatenate[T, P], Any],
+    *args: P.args,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    ordered: bool = False,
+    window: int | None = None,
+    chunksize: int | None = None,
+    **kwargs: P.kwargs,
+) -> Iterable[T]:
+    return (
+        item
+        for item, _ in _execute(
+            iterable,
+            func,
+            args,
+            kwargs,
+            executor,
+            max_workers,
+            ordered,
+            window,
+            chunksize,
+        )
+    )
+
+
+def filter[T, **P, R](
+    iterable: Iterable[T],
+    func: Callable[Concatenate[T, P], R],
+    *args: P.args,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    ordered: bool = False,
+    window: int | None = None,
+    chunksize: int | None = None,
+    **kwargs: P.kwargs,
+) -> Iterable[T]:
+    return (
+        item
+        for item, result in _execute(
+            iterable,
+            func,
+            args,
+            kwargs,
+            executor,
+            max_workers,
+            ordered,
+            window,
+            chunksize,
+        )
+        if result
+    )
@@ -0,0 +1,129 @@
+from contextlib import aclosing
+from inspect import isawaitable
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Concatenate,
+    Iterable,
+)
+
+from tibia.utils import iterate_async
+
+
+async def _call[T, **P, R](
+    func: Callable[Concatenate[T, P], R | Awaitable[R]],
+    item: T,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> R:
+    result = func(item, *args, **kwargs)
+
+    if isawaitable(result):
+        return await result
+
+    return result
+
+
+async def map[T, **P, R](
+    iterable: Iterable[T] | AsyncIterable[T],
+    func: Callable[Concatenate[T, P], R | Awaitable[R]],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> AsyncIterator[R]:
+    async with aclosing(iterate_async(iterable)) as items:
+        async for item in items:
+            yield await _call(func, item, *args, **kwargs)
+
+
+async def inspect[T, **P](
+    iterable: Iterable[T] | AsyncIterable[T],
+    func: Callable[Concatenate[T, P], Any],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> AsyncIterator[T]:
+    async with aclosing(iterate_async(iterable)) as items:
+        async for item in items:
+            await _call(func, item, *args, **kwargs)
+            yield item
+
+
+async def filter[T, **P](
+    iterable: Iterable[T] | AsyncIterable[T],
+    func: Callable[Concatenate[T, P], bool | Awaitable[bool]],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> AsyncIterator[T]:
+    async with aclosing(iterate_async(iterable)) as items:
+        async for item in items:
+            if await _call(func, item, *args, **kwargs):
+                yield item
+
+
+async def skip_while[T, **P](
+    iterable: Iterable[T] | AsyncIterable[T],
+    fn: Callable[Concatenate[T, P], bool | Awaitable[bool]],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> AsyncIterator[T]:
+    is_skipping = True
+
+    async with aclosing(iterate_async(iterable)) as items:
+        async for item in items:
+            if is_skipping:
+                is_skipping = await _call(fn, item, *args, **kwargs)
+
+            if is_skipping:
+                continue
+
+            yield item
+
+
+async def take_while[T, **P](
+    iterable: Iterable[T] | AsyncIterable[T],
+    fn: Callable[Concatenate[T, P], bool | Awaitable[bool]],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> AsyncIterator[T]:
+    # source is closed as soon as predicate fails, not when it is collected
+    async with aclosing(iterate_async(iterable)) as items:
+        async for item in items:
+            if await _call(fn, item, *args, **kwargs):
+                yield item
+                continue
+
+            break
+
+
+async def join[T](
+    iterable: Iterable[Iterable[T] | AsyncIterable[T]]
+    | AsyncIterable[Iterable[T] | AsyncIterable[T]],
+) -> AsyncIterator[T]:
+    async with aclosing(iterate_async(iterable)) as sub_iterables:
+        async for sub_iterable in sub_iterables:
+            async with aclosing(iterate_async(sub_iterable)) as items:
+                async for item in items:
+                    yield item
+
+
+async def batch[T](
+    iterable: Iterable[T] | AsyncIterable[T],
+    size: int,
+) -> AsyncIterator[list[T]]:
+    if size < 1:
+        raise ValueError("size must be positive")
+
+    chunk = []
+
+    async with aclosing(iterate_async(iterable)) as items:
+        async for item in items:
+            chunk.append(item)
+
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
@@ -1,44 +1,180 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Callable, Concatenate, Iterable
+import os
+import sys
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from queue import SimpleQueue
+from typing import Any, Callable, Concatenate, Iterable, Iterator
+
+
+@contextmanager
+def _pool(
+    executor: Executor | None,
+    max_workers: int | None,
+    executor_type: Callable[[int | None], Executor],
+) -> Iterator[Executor]:
+    # shared executor is owned by caller and is not shut down here
+    if executor is not None:
+        yield executor
+        return
+
+    with executor_type(max_workers) as _executor:
+        yield _executor
+
+
+def _gil_enabled() -> bool:
+    # GIL can be enabled at runtime of free-threaded build (e.g. by an extension
+    # module that does not support it), so it is checked on every call
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _default_workers() -> int:
+    cpus = os.cpu_count() or 1
+
+    # with GIL threads mostly wait for I/O, so pool is oversubscribed like
+    # `ThreadPoolExecutor` default, without it they run in parallel on cores
+    if _gil_enabled():
+        return min(32, cpus + 4)
+
+    return cpus
+
+
+def _execute[T, R](
+    iterable: Iterable[T],
+    func: Callable[..., R],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    executor: Executor | None,
+    max_workers: int | None,
+    ordered: bool,
+    window: int | None,
+    executor_type: Callable[[int | None], Executor] = ThreadPoolExecutor,
+) -> Iterator[tuple[T, R]]:
+    if max_workers is None:
+        max_workers = _default_workers()
+
+    # keep every worker busy while the consumer handles finished results
+    if window is None:
+        window = 2 * max_workers
+
+    # arguments are checked before the first item is requested
+    if window < 1:
+        raise ValueError("window must be positive")
+
+    return _run(
+        iterable,
+        func,
+        args,
+        kwargs,
+        executor,
+        max_workers,
+        ordered,
+        window,
+        executor_type,
+    )
+
+
+def _run[T, R](
+    iterable: Iterable[T],
+    func: Callable[..., R],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    executor: Executor | None,
+    max_workers: int,
+    ordered: bool,
+    window: int,
+    executor_type: Callable[[int | None], Executor],
+) -> Iterator[tuple[T, R]]:
+    items = iter(iterable)
+    # at most `window` futures are in flight: in submission order for ordered
+    # mode, otherwise finished ones are taken from the queue they report to
+    in_order: deque[tuple[T, Future[R]]] = deque()
+    pending: dict[Future[R], T] = {}
+    done: SimpleQueue[Future[R]] = SimpleQueue()
+
+    with _pool(executor, max_workers, executor_type) as _executor:
+        try:
+            while True:
+                for item in islice(items, window - len(in_order) - len(pending)):
+                    future = _executor.submit(func, item, *args, **kwargs)
+
+                    if ordered:
+                        in_order.append((item, future))
+                    else:
+                        pending[future] = item
+                        future.add_done_callback(done.put)
+
+                if ordered:
+                    if not in_order:
+                        return
+
+                    item, future = in_order.popleft()
+                    yield item, future.result()
+                else:
+                    if not pending:
+                        return
+
+                    future = done.get()
+                    yield pending.pop(future), future.result()
+        finally:
+            for _, future in in_order:
+                future.cancel()
+
+            for future in pending:
+                future.cancel()
 
 
 def map[T, **P, R](
     iterable: Iterable[T],
     func: Callable[Concatenate[T, P], R],
     *args: P.args,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    ordered: bool = False,
+    window: int | None = None,
     **kwargs: P.kwargs,
 ) -> Iterable[R]:
-    with ThreadPoolExecutor() as _executor:
-        for future in as_completed(
-            (_executor.submit(func, item, *args, **kwargs) for item in iterable),
-        ):
-            yield future.result()
+    return (
+        result
+        for _, result in _execute(
+            iterable, func, args, kwargs, executor, max_workers, ordered, window
+        )
+    )
 
 
 def inspect[T, **P](
     iterable: Iterable[T],
     func: Callable[Concatenate[T, P], Any],
     *args: P.args,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    ordered: bool = False,
+    window: int | None = None,
     **kwargs: P.kwargs,
 ) -> Iterable[T]:
-    with ThreadPoolExecutor() as _executor:
-        future_to_value = {
-            _executor.submit(func, item, *args, **kwargs): item for item in iterable
-        }
-        for future in as_completed(future_to_value):
-            yield future_to_value[future]
+    return (
+        item
+        for item, _ in _execute(
+            iterable, func, args, kwargs, executor, max_workers, ordered, window
+        )
+    )
 
 
 def filter[T, **P, R](
     iterable: Iterable[T],
     func: Callable[Concatenate[T, P], R],
     *args: P.args,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    ordered: bool = False,
+    window: int | None = None,
     **kwargs: P.kwargs,
 ) -> Iterable[T]:
-    with ThreadPoolExecutor() as _executor:
-        future_to_value = {
-            _executor.submit(func, item, *args, **kwargs): item for item in iterable
-        }
-        for future in as_completed(future_to_value):
-            if future.result():
-                yield future_to_value[future]
+    return (
+        item
+        for item, result in _execute(
+            iterable, func, args, kwargs, executor, max_workers, ordered, window
+        )
+        if result
+    )
@@ -3,13 +3,16 @@ from __future__ import annotations
 import functools
 import warnings
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Concatenate, cast
+from typing import Any, Awaitable, Callable, Concatenate, Iterable, cast
 
 from tibia import future_maybe as fm
 from tibia.future import Future
+from tibia.utils import identity_async
 
 
 class Maybe[T]:
+    __slots__ = ()
+
     @staticmethod
     def from_value[I](value: I) -> Maybe[I]:
         return from_value(value)
@@ -138,12 +141,11 @@ class Maybe[T]:
 
     @staticmethod
     def wraps[**P, R](fn: Callable[P, R]) -> Callable[P, Maybe[R]]:
-        warnings.simplefilter("always", DeprecationWarning)
         warnings.warn(
             "Maybe.wraps will be deprecated in tibia@3.0.0, use maybe.wraps instead",
             DeprecationWarning,
+            stacklevel=2,
         )
-        warnings.simplefilter("default", DeprecationWarning)
 
         @functools.wraps(fn)
         def _wraps(*args: P.args, **kwargs: P.kwargs) -> Maybe[R]:
@@ -153,13 +155,12 @@ class Maybe[T]:
 
     @staticmethod
     def wraps_optional[**P, R](fn: Callable[P, R | None]) -> Callable[P, Maybe[R]]:
-        warnings.simplefilter("always", DeprecationWarning)
         warnings.warn(
             "Maybe.wraps_optional will be deprecated in tibia@3.0.0, "
             "use maybe.safe instead",
             DeprecationWarning,
+            stacklevel=2,
         )
-        warnings.simplefilter("default", DeprecationWarning)
 
         @functools.wraps(fn)
         def _wraps_optional(*args: P.args, **kwargs: P.kwargs) -> Maybe[R]:
@@ -168,27 +169,260 @@ class Maybe[T]:
         return _wraps_optional
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True, init=False)
 class Some[T](Maybe[T]):
     _internal: T
 
+    def __new__(cls, _internal: T) -> Some[T]:
+        if _internal is None or _internal is True or _internal is False:
+            return _some_interned[_internal]
+
+        self = object.__new__(cls)
+        object.__setattr__(self, "_internal", _internal)
+        return self
+
+    def __reduce__(self) -> tuple[type[Some[T]], tuple[T]]:
+        return Some, (self._internal,)
+
     def __eq__(self, value: Maybe[Any]):
         if isinstance(value, Some):
             return self._internal.__eq__(value._internal)
 
         return False
 
+    def __hash__(self) -> int:
+        return hash(self._internal)
+
+    def is_empty(self) -> bool:
+        return False
+
+    def is_empty_or[**P](
+        self,
+        fn: Callable[Concatenate[T, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return fn(self._internal, *args, **kwargs)
+
+    def is_empty_or_async[**P](
+        self,
+        fn: Callable[Concatenate[T, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(fn(self._internal, *args, **kwargs))
+
+    def is_some(self) -> bool:
+        return True
+
+    def is_some_and[**P](
+        self,
+        fn: Callable[Concatenate[T, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return fn(self._internal, *args, **kwargs)
+
+    def is_some_and_async[**P](
+        self,
+        fn: Callable[Concatenate[T, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(fn(self._internal, *args, **kwargs))
+
+    def expect(self, what: str) -> T:
+        return self._internal
+
+    def unwrap(self) -> T:
+        return self._internal
+
+    def unwrap_or(self, default: T) -> T:
+        return self._internal
+
+    def unwrap_or_none(self) -> T | None:
+        return self._internal
+
+    def map[**P, R](
+        self,
+        fn: Callable[Concatenate[T, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Maybe[R]:
+        return Some(fn(self._internal, *args, **kwargs))
+
+    def map_async[**P, R](
+        self,
+        fn: Callable[Concatenate[T, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fm.FutureMaybe[R]:
+        return fm.FutureMaybe(_some_async(fn(self._internal, *args, **kwargs)))
+
+    def map_or[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[T, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        return fn(self._internal, *args, **kwargs)
 
-@dataclass(slots=True)
+    def map_or_async[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[T, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[R]:
+        return Future(fn(self._internal, *args, **kwargs))
+
+    def inspect[**P](
+        self,
+        fn: Callable[Concatenate[T, P], Any],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Maybe[T]:
+        fn(self._internal, *args, **kwargs)
+        return self
+
+    def inspect_async[**P](
+        self,
+        fn: Callable[Concatenate[T, P], Awaitable[Any]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fm.FutureMaybe[T]:
+        return fm.FutureMaybe(_then(fn(self._internal, *args, **kwargs), self))
+
+
+@dataclass(slots=True, eq=False)
 class Empty(Maybe[Any]):
-    def __eq__(self, value: Maybe[Any]):
-        if value is _Empty or isinstance(value, Empty):
-            return True
+    def __new__(cls) -> Empty:
+        return _Empty
 
+    def is_empty(self) -> bool:
+        return True
+
+    def is_empty_or[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return True
+
+    def is_empty_or_async[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(identity_async(True))
+
+    def is_some(self) -> bool:
         return False
 
+    def is_some_and[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return False
 
-_Empty = Empty()
+    def is_some_and_async[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(identity_async(False))
+
+    def expect(self, what: str) -> Any:
+        raise ValueError(what)
+
+    def unwrap(self) -> Any:
+        raise ValueError("must be some")
+
+    def unwrap_or[T](self, default: T) -> T:
+        return default
+
+    def unwrap_or_none(self) -> None:
+        return None
+
+    def map[**P, R](
+        self,
+        fn: Callable[Concatenate[Any, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Maybe[R]:
+        return self
+
+    def map_async[**P, R](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fm.FutureMaybe[R]:
+        return fm.FutureMaybe(identity_async(self))
+
+    def map_or[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[Any, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        return default
+
+    def map_or_async[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[Any, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[R]:
+        return Future(identity_async(default))
+
+    def inspect[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Any],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Maybe[Any]:
+        return self
+
+    def inspect_async[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[Any]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fm.FutureMaybe[Any]:
+        return fm.FutureMaybe(identity_async(self))
+
+
+_Empty = object.__new__(Empty)
+
+
+def _new_some[T](value: T) -> Some[T]:
+    # bypasses `__new__`, which returns instances from this very mapping
+    instance = object.__new__(Some)
+    object.__setattr__(instance, "_internal", value)
+    return instance
+
+
+_some_interned: dict[Any, Some[Any]] = {
+    value: _new_some(value) for value in (None, True, False)
+}
+
+
+async def _some_async[T](value: Awaitable[T]) -> Maybe[T]:
+    return Some(await value)
+
+
+async def _then[T](awaitable: Awaitable[Any], value: T) -> T:
+    await awaitable
+    return value
 
 
 def from_value[T](value: T) -> Maybe[T]:
@@ -372,6 +606,46 @@ async def inspect_async[T, **P](
     return m
 
 
+def compact[T](maybes: Iterable[Maybe[T]]) -> list[T]:
+    return [m._internal for m in maybes if isinstance(m, Some)]
+
+
+def filter_map[T, **P, R](
+    iterable: Iterable[T],
+    fn: Callable[Concatenate[T, P], Maybe[R]],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> list[R]:
+    result = []
+
+    for item in iterable:
+        m = fn(item, *args, **kwargs)
+
+        if isinstance(m, Some):
+            result.append(m._internal)
+
+    return result
+
+
+def iterate_some[T](maybes: Iterable[Maybe[T]]) -> Iterable[T]:
+    for m in maybes:
+        if isinstance(m, Some):
+            yield m._internal
+
+
+def iterate_filter_map[T, **P, R](
+    iterable: Iterable[T],
+    fn: Callable[Concatenate[T, P], Maybe[R]],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> Iterable[R]:
+    for item in iterable:
+        m = fn(item, *args, **kwargs)
+
+        if isinstance(m, Some):
+            yield m._internal
+
+
 def match_some[**P, T](*fns: Callable[P, Maybe[T]]) -> Callable[P, Maybe[T]]:
     def _match_some(*args: P.args, **kwargs: P.kwargs) -> Maybe[T]:
         for fn in fns:
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Concatenate, Iterable
+
+# (fn, args, kwargs, keeps_value)
+type _Step = tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any], bool]
+
+
+class Pipeline[T, R]:
+    __slots__ = ("_steps", "_compiled")
+
+    _steps: tuple[_Step, ...]
+    _compiled: Callable[[T], R] | None
+
+    def __init__(self, _steps: tuple[_Step, ...] = ()):
+        self._steps = _steps
+        self._compiled = None
+
+    def __call__(self, value: T) -> R:
+        return self.compile()(value)
+
+    def map[**P, R_](
+        self,
+        fn: Callable[Concatenate[R, P], R_],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Pipeline[T, R_]:
+        return Pipeline((*self._steps, (fn, args, kwargs, False)))
+
+    def inspect[**P](
+        self,
+        fn: Callable[Concatenate[R, P], Any],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Pipeline[T, R]:
+        return Pipeline((*self._steps, (fn, args, kwargs, True)))
+
+    def compile(self) -> Callable[[T], R]:
+        if self._compiled is None:
+            self._compiled = _compile(self._steps)
+
+        return self._compiled
+
+    def apply(self, iterable: Iterable[T]) -> list[R]:
+        run = self.compile()
+        return [run(value) for value in iterable]
+
+
+def _compile(steps: tuple[_Step, ...]) -> Callable[[Any], Any]:
+    def _run(value: Any) -> Any:
+        for fn, args, kwargs, keeps_value in steps:
+            if keeps_value:
+                fn(value, *args, **kwargs)
+            else:
+                value = fn(value, *args, **kwargs)
+
+        return value
+
+    return _run
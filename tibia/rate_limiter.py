@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Concatenate
+
+
+class RateLimiter:
+    __slots__ = ("_rate", "_burst", "_tokens", "_updated", "_lock")
+
+    _rate: float
+    _burst: float
+    _tokens: float
+    _updated: float
+    _lock: asyncio.Lock
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        if burst < 1:
+            raise ValueError("burst must be positive")
+
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        # lock is fair, so waiting callers are served in arrival order and
+        # only the head of the queue sleeps for the next token
+        async with self._lock:
+            self._refill()
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+
+            self._tokens -= 1
+
+    async def __aenter__(self) -> RateLimiter:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        pass
+
+    def limit[T, **P, R](
+        self,
+        func: Callable[Concatenate[T, P], Awaitable[R]],
+    ) -> Callable[Concatenate[T, P], Awaitable[R]]:
+        async def _limited(item: T, *args: P.args, **kwargs: P.kwargs) -> R:
+            await self.acquire()
+            return await func(item, *args, **kwargs)
+
+        return _limited
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import functools
+import traceback
 import warnings
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Concatenate, Iterable, cast
 
 from tibia import future_result as fr
 from tibia.future import Future
+from tibia.utils import identity_async
 
 
 class Result[T, E]:
+    __slots__ = ()
+
     def is_ok(self) -> bool:
         return is_ok(self)
 
@@ -200,12 +204,11 @@ class Result[T, E]:
 
     @staticmethod
     def wraps[**P, R](func: Callable[P, R]) -> Callable[P, Result[R, Exception]]:
-        warnings.simplefilter("always", DeprecationWarning)
         warnings.warn(
             "Result.wraps will be deprecated in tibia@3.0.0, use result.wraps instead",
             DeprecationWarning,
+            stacklevel=2,
         )
-        warnings.simplefilter("default", DeprecationWarning)
 
         @functools.wraps(func)
         def _wraps(*args: P.args, **kwargs: P.kwargs) -> Result[R, Exception]:
@@ -215,13 +218,12 @@ class Result[T, E]:
 
     @staticmethod
     def safe(*exceptions: Exception):
-        warnings.simplefilter("always", DeprecationWarning)
         warnings.warn(
             "Result.safe will be deprecated in tibia@3.0.0, "
             "use result.safe or result.safe_from instead",
             DeprecationWarning,
+            stacklevel=2,
         )
-        warnings.simplefilter("default", DeprecationWarning)
 
         if not exceptions:
             exceptions = (Exception,)
@@ -239,18 +241,221 @@ class Result[T, E]:
         return _safe
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True, init=False)
 class Ok[T](Result[T, Any]):
     _internal: T
 
+    def __new__(cls, _internal: T) -> Ok[T]:
+        if _internal is None or _internal is True or _internal is False:
+            return _ok_interned[_internal]
+
+        self = object.__new__(cls)
+        object.__setattr__(self, "_internal", _internal)
+        return self
+
+    def __reduce__(self) -> tuple[type[Ok[T]], tuple[T]]:
+        return Ok, (self._internal,)
+
     def __eq__(self, result: Result):
         if not isinstance(result, Ok):
             return self._internal.__eq__(result)
 
         return self._internal.__eq__(result._internal)
 
+    def __hash__(self) -> int:
+        return hash(self._internal)
+
+    def is_ok(self) -> bool:
+        return True
+
+    def is_ok_and[**P](
+        self,
+        fn: Callable[Concatenate[T, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return fn(self._internal, *args, **kwargs)
+
+    def is_ok_and_async[**P](
+        self,
+        fn: Callable[Concatenate[T, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(fn(self._internal, *args, **kwargs))
+
+    def is_ok_or[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return True
+
+    def is_ok_or_async[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(identity_async(True))
+
+    def expect(self, what: str) -> T:
+        return self._internal
+
+    def unwrap(self) -> T:
+        return self._internal
+
+    def unwrap_or(self, default: T) -> T:
+        return self._internal
+
+    def map[**P, R](
+        self,
+        fn: Callable[Concatenate[T, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Result[R, Any]:
+        return Ok(fn(self._internal, *args, **kwargs))
+
+    def map_async[**P, R](
+        self,
+        fn: Callable[Concatenate[T, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fr.FutureResult[R, Any]:
+        return fr.FutureResult(_ok_async(fn(self._internal, *args, **kwargs)))
+
+    def map_or[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[T, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        return fn(self._internal, *args, **kwargs)
+
+    def map_or_async[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[T, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[R]:
+        return Future(fn(self._internal, *args, **kwargs))
+
+    def inspect[**P](
+        self,
+        fn: Callable[Concatenate[T, P], Any],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Result[T, Any]:
+        fn(self._internal, *args, **kwargs)
+        return self
+
+    def inspect_async[**P](
+        self,
+        fn: Callable[Concatenate[T, P], Awaitable[Any]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fr.FutureResult[T, Any]:
+        return fr.FutureResult(_then(fn(self._internal, *args, **kwargs), self))
+
+    def is_err(self) -> bool:
+        return False
+
+    def is_err_and[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return False
+
+    def is_err_and_async[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(identity_async(False))
+
+    def is_err_or[**P](
+        self,
+        fn: Callable[Concatenate[T, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return fn(self._internal, *args, **kwargs)
+
+    def is_err_or_async[**P](
+        self,
+        fn: Callable[Concatenate[T, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(fn(self._internal, *args, **kwargs))
+
+    def expect_err(self, what: str) -> Any:
+        raise ValueError(what)
+
+    def unwrap_err(self) -> Any:
+        raise ValueError("must be err")
+
+    def unwrap_err_or[E](self, default: E) -> E:
+        return default
+
+    def map_err[**P, R](
+        self,
+        fn: Callable[Concatenate[Any, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Result[T, R]:
+        return self
+
+    def map_err_async[**P, R](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fr.FutureResult[T, R]:
+        return fr.FutureResult(identity_async(self))
+
+    def map_err_or[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[Any, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        return default
+
+    def map_err_or_async[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[Any, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[R]:
+        return Future(identity_async(default))
+
+    def inspect_err[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Any],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Result[T, Any]:
+        return self
 
-@dataclass(slots=True)
+    def inspect_err_async[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[Any]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fr.FutureResult[T, Any]:
+        return fr.FutureResult(identity_async(self))
+
+
+@dataclass(slots=True, frozen=True)
 class Err[E](Result[Any, E]):
     _internal: E
 
@@ -260,6 +465,273 @@ class Err[E](Result[Any, E]):
 
         return self._internal.__eq__(result._internal)
 
+    def __hash__(self) -> int:
+        return hash(self._internal)
+
+    def is_ok(self) -> bool:
+        return False
+
+    def is_ok_and[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return False
+
+    def is_ok_and_async[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(identity_async(False))
+
+    def is_ok_or[**P](
+        self,
+        fn: Callable[Concatenate[E, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return fn(self._internal, *args, **kwargs)
+
+    def is_ok_or_async[**P](
+        self,
+        fn: Callable[Concatenate[E, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(fn(self._internal, *args, **kwargs))
+
+    def expect(self, what: str) -> Any:
+        raise ValueError(what)
+
+    def unwrap(self) -> Any:
+        raise ValueError("must be ok")
+
+    def unwrap_or[T](self, default: T) -> T:
+        return default
+
+    def map[**P, R](
+        self,
+        fn: Callable[Concatenate[Any, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Result[R, E]:
+        return self
+
+    def map_async[**P, R](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fr.FutureResult[R, E]:
+        return fr.FutureResult(identity_async(self))
+
+    def map_or[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[Any, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        return default
+
+    def map_or_async[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[Any, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[R]:
+        return Future(identity_async(default))
+
+    def inspect[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Any],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Result[Any, E]:
+        return self
+
+    def inspect_async[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[Any]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fr.FutureResult[Any, E]:
+        return fr.FutureResult(identity_async(self))
+
+    def is_err(self) -> bool:
+        return True
+
+    def is_err_and[**P](
+        self,
+        fn: Callable[Concatenate[E, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return fn(self._internal, *args, **kwargs)
+
+    def is_err_and_async[**P](
+        self,
+        fn: Callable[Concatenate[E, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(fn(self._internal, *args, **kwargs))
+
+    def is_err_or[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], bool],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> bool:
+        return True
+
+    def is_err_or_async[**P](
+        self,
+        fn: Callable[Concatenate[Any, P], Awaitable[bool]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[bool]:
+        return Future(identity_async(True))
+
+    def expect_err(self, what: str) -> E:
+        return self._internal
+
+    def unwrap_err(self) -> E:
+        return self._internal
+
+    def unwrap_err_or(self, default: E) -> E:
+        return self._internal
+
+    def map_err[**P, R](
+        self,
+        fn: Callable[Concatenate[E, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Result[Any, R]:
+        return Err(fn(self._internal, *args, **kwargs))
+
+    def map_err_async[**P, R](
+        self,
+        fn: Callable[Concatenate[E, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fr.FutureResult[Any, R]:
+        return fr.FutureResult(_err_async(fn(self._internal, *args, **kwargs)))
+
+    def map_err_or[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[E, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        return fn(self._internal, *args, **kwargs)
+
+    def map_err_or_async[**P, R](
+        self,
+        default: R,
+        fn: Callable[Concatenate[E, P], Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[R]:
+        return Future(fn(self._internal, *args, **kwargs))
+
+    def inspect_err[**P](
+        self,
+        fn: Callable[Concatenate[E, P], Any],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Result[Any, E]:
+        fn(self._internal, *args, **kwargs)
+        return self
+
+    def inspect_err_async[**P](
+        self,
+        fn: Callable[Concatenate[E, P], Awaitable[Any]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> fr.FutureResult[Any, E]:
+        return fr.FutureResult(_then(fn(self._internal, *args, **kwargs), self))
+
+
+async def _ok_async[T](value: Awaitable[T]) -> Result[T, Any]:
+    return Ok(await value)
+
+
+async def _err_async[E](value: Awaitable[E]) -> Result[Any, E]:
+    return Err(await value)
+
+
+async def _then[T](awaitable: Awaitable[Any], value: T) -> T:
+    await awaitable
+    return value
+
+
+def _new_ok[T](value: T) -> Ok[T]:
+    # bypasses `__new__`, which returns instances from this very mapping
+    instance = object.__new__(Ok)
+    object.__setattr__(instance, "_internal", value)
+    return instance
+
+
+_ok_interned: dict[Any, Ok[Any]] = {
+    value: _new_ok(value) for value in (None, True, False)
+}
+
+
+@dataclass(slots=True, frozen=True)
+class ErrorRecord:
+    type: type[BaseException]
+    message: str
+    # (filename, lineno, function name) per frame, source lines are read lazily
+    stack: tuple[tuple[str, int, str], ...] | None = None
+
+    @staticmethod
+    def from_exception(
+        exc: BaseException,
+        with_traceback: bool = False,
+    ) -> ErrorRecord:
+        stack = None
+
+        if with_traceback:
+            stack = tuple(
+                (frame.f_code.co_filename, lineno, frame.f_code.co_name)
+                for frame, lineno in traceback.walk_tb(exc.__traceback__)
+            )
+
+        return ErrorRecord(exc.__class__, str(exc), stack)
+
+    def format_traceback(self) -> str:
+        if self.stack is None:
+            return ""
+
+        return "".join(
+            traceback.StackSummary.from_list(
+                [
+                    traceback.FrameSummary(*frame, lookup_line=False)
+                    for frame in self.stack
+                ]
+            ).format()
+        )
+
+    def __str__(self) -> str:
+        return f"{self.type.__name__}: {self.message}"
+
+
+def _capture(
+    exc: BaseException,
+    record: bool,
+    with_traceback: bool,
+) -> BaseException | ErrorRecord:
+    if record:
+        return ErrorRecord.from_exception(exc, with_traceback)
+
+    return exc
+
 
 def is_ok[T, E](r: Result[T, E]) -> bool:
     return isinstance(r, Ok)
@@ -541,6 +1013,42 @@ async def inspect_err_async[T, E, **P](
     return r
 
 
+def partition[T, E](results: Iterable[Result[T, E]]) -> tuple[list[T], list[E]]:
+    oks, errs = [], []
+
+    for result in results:
+        if isinstance(result, Ok):
+            oks.append(result._internal)
+        else:
+            errs.append(result._internal)
+
+    return oks, errs
+
+
+def collect[T, E](results: Iterable[Result[T, E]]) -> Result[list[T], E]:
+    values = []
+
+    for result in results:
+        if isinstance(result, Err):
+            return result
+
+        values.append(result._internal)
+
+    return Ok(values)
+
+
+def iterate_ok[T, E](results: Iterable[Result[T, E]]) -> Iterable[T]:
+    for result in results:
+        if isinstance(result, Ok):
+            yield result._internal
+
+
+def iterate_err[T, E](results: Iterable[Result[T, E]]) -> Iterable[E]:
+    for result in results:
+        if isinstance(result, Err):
+            yield result._internal
+
+
 def match_ok[**P, T, E](*fns: Callable[P, Result[T, E]]) -> Callable[P, Result[T, E]]:
     def _match_ok(*args: P.args, **kwargs: P.kwargs) -> Result[T, E]:
         for fn in fns:
@@ -562,17 +1070,26 @@ def wraps[**P, T](fn: Callable[P, T]) -> Callable[P, Result[T, Exception]]:
     return _wraps
 
 
-def safe_from(*exceptions: Exception):
+def safe_from(
+    *exceptions: Exception,
+    record: bool = False,
+    with_traceback: bool = False,
+):
     if not exceptions:
         exceptions = (Exception,)
 
-    def _safe_from[**P, T](fn: Callable[P, T]) -> Callable[P, Result[T, Exception]]:
+    def _safe_from[**P, T](
+        fn: Callable[P, T],
+    ) -> Callable[P, Result[T, Exception | ErrorRecord]]:
         @functools.wraps(fn)
-        def __safe_from(*args: P.args, **kwargs: P.kwargs) -> Result[T, Exception]:
+        def __safe_from(
+            *args: P.args,
+            **kwargs: P.kwargs,
+        ) -> Result[T, Exception | ErrorRecord]:
             try:
                 return Ok(fn(*args, **kwargs))
             except exceptions as exc:
-                return Err(exc)
+                return Err(_capture(exc, record, with_traceback))
 
         return __safe_from
 
@@ -1,6 +1,31 @@
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+
+
 def identity[T](value: T) -> T:
     return value
 
 
 async def identity_async[T](value: T) -> T:
     return value
+
+
+def unroll[T](chain: tuple[T, Any] | None) -> list[T]:
+    steps = []
+
+    while chain is not None:
+        step, chain = chain
+        steps.append(step)
+
+    steps.reverse()
+    return steps
+
+
+async def iterate_async[T](
+    iterable: Iterable[T] | AsyncIterable[T],
+) -> AsyncIterator[T]:
+    if isinstance(iterable, AsyncIterable):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item